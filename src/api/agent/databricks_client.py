@@ -4,32 +4,129 @@ Provides connection management and query execution for agent tools.
 """
 
 import json
+import logging
+import queue
+import threading
+import time
 from contextlib import contextmanager
 from typing import Any, Generator, Optional
 from databricks import sql
-from databricks.sql.client import Connection, Cursor
+from databricks.sql.client import Connection
+
+# Optional (databricks-sql-connector[pyarrow]): Arrow fetches build the row
+# dicts in C; without it rows are zipped from tuples in Python
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
 
 from config.settings import get_config, DatabricksConfig
 
+logger = logging.getLogger(__name__)
+
+# Rows fetched per Arrow batch; bounds how much raw result data is held
+# alongside the converted row dicts
+FETCH_BATCH_ROWS = 1000
+
+# Successful query results kept by execute_cached_query, and for how long;
+# the gold tables it serves are refreshed by batch loads, not live
+RESULT_CACHE_SIZE = 256
+RESULT_CACHE_TTL_SECONDS = 600
+
 
 class DatabricksClient:
-    """Client for executing queries against Databricks SQL warehouse."""
+    """
+    Client for executing queries against Databricks SQL warehouse.
+
+    Connections are kept in a small thread-safe pool so consecutive queries
+    reuse an open session instead of paying the TLS + auth handshake each time.
+    """
+
+    def __init__(
+        self,
+        config: Optional[DatabricksConfig] = None,
+        pool_size: int = 5,
+        max_idle_seconds: float = 300.0
+    ):
+        """
+        Initialize the client.
 
-    def __init__(self, config: Optional[DatabricksConfig] = None):
+        Args:
+            config: Databricks configuration (loaded from env if None)
+            pool_size: Maximum number of idle connections kept open
+            max_idle_seconds: Idle connections older than this are discarded
+        """
         self.config = config or get_config().databricks
+        self.pool_size = pool_size
+        self.max_idle_seconds = max_idle_seconds
+        # (connection, released_at) pairs; queue.Queue is already thread-safe
+        self._pool: queue.Queue = queue.Queue(maxsize=pool_size)
+        # (query, params, max_rows) -> (stored_at, result), bounded FIFO;
+        # tools run concurrently, so access is locked
+        self._result_cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
+        self._result_cache_lock = threading.Lock()
 
-    @contextmanager
-    def connection(self) -> Generator[Connection, None, None]:
-        """Context manager for database connections."""
-        conn = sql.connect(
+    def _connect(self) -> Connection:
+        """Open a new warehouse connection."""
+        return sql.connect(
             server_hostname=self.config.host,
             http_path=self.config.http_path,
             access_token=self.config.token,
         )
+
+    @staticmethod
+    def _close_quietly(conn: Connection):
+        """Close a connection, tolerating errors from already-dead sessions."""
         try:
-            yield conn
-        finally:
             conn.close()
+        except (sql.Error, OSError) as e:
+            logger.debug("Ignoring error closing Databricks connection: %s", e)
+
+    def _acquire(self) -> Connection:
+        """Take a fresh-enough pooled connection, or open a new one."""
+        while True:
+            try:
+                conn, released_at = self._pool.get_nowait()
+            except queue.Empty:
+                return self._connect()
+
+            if time.monotonic() - released_at <= self.max_idle_seconds:
+                return conn
+            # Idle too long - the server may have expired the session
+            self._close_quietly(conn)
+
+    def _release(self, conn: Connection):
+        """Return a connection to the pool, closing it if the pool is full."""
+        try:
+            self._pool.put_nowait((conn, time.monotonic()))
+        except queue.Full:
+            self._close_quietly(conn)
+
+    @contextmanager
+    def connection(self) -> Generator[Connection, None, None]:
+        """
+        Context manager for pooled database connections.
+
+        The connection goes back to the pool on success and is closed if the
+        block raises, so a broken session is never handed out again.
+        """
+        conn = self._acquire()
+        try:
+            yield conn
+        except BaseException:
+            self._close_quietly(conn)
+            raise
+        else:
+            self._release(conn)
+
+    def close(self):
+        """Close all idle pooled connections."""
+        while True:
+            try:
+                conn, _ = self._pool.get_nowait()
+            except queue.Empty:
+                return
+            self._close_quietly(conn)
 
     def execute_query(
         self,
@@ -49,9 +146,9 @@ class DatabricksClient:
             Dict with success status, row_count, columns, and data
         """
         try:
-            with self.connection() as conn:
-                cursor: Cursor = conn.cursor()
-                cursor.execute(query, params)
+            # Close the cursor explicitly - pooled connections outlive it
+            with self.connection() as conn, conn.cursor() as cursor:
+                cursor.execute(query, params or None)
 
                 # Check if this is a SELECT query (has result set)
                 # INSERT/UPDATE/DELETE don't return description
@@ -67,8 +164,7 @@ class DatabricksClient:
                     }
 
                 columns = [desc[0] for desc in cursor.description]
-                rows = cursor.fetchmany(max_rows)
-                data = [dict(zip(columns, row)) for row in rows]
+                data = self._fetch_rows(cursor, columns, max_rows)
                 has_more = cursor.fetchone() is not None
 
                 return {
@@ -86,6 +182,68 @@ class DatabricksClient:
                 "error_type": type(e).__name__
             }
 
+    @staticmethod
+    def _fetch_rows(cursor, columns: list[str], max_rows: int) -> list[dict[str, Any]]:
+        """
+        Fetch up to max_rows rows as dicts, FETCH_BATCH_ROWS at a time.
+
+        Each batch is released before the next one is fetched. With pyarrow,
+        to_pylist() builds the row dicts in C instead of a per-row
+        dict(zip(...)) in Python.
+        """
+        data = []
+        remaining = max_rows
+        while remaining > 0:
+            size = min(remaining, FETCH_BATCH_ROWS)
+            if pyarrow is not None:
+                rows = cursor.fetchmany_arrow(size).to_pylist()
+            else:
+                rows = [dict(zip(columns, row)) for row in cursor.fetchmany(size)]
+            if not rows:
+                break
+            data.extend(rows)
+            remaining -= len(rows)
+        return data
+
+    def execute_cached_query(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        max_rows: int = 100,
+        ttl_seconds: float = RESULT_CACHE_TTL_SECONDS
+    ) -> dict[str, Any]:
+        """
+        Execute a query, reusing a recent successful result for the same SQL.
+
+        For slowly changing aggregates that the model tends to ask for
+        repeatedly. The returned dict is shared between callers and must
+        not be modified.
+
+        Args:
+            query: SQL query to execute
+            params: Optional query parameters
+            max_rows: Maximum rows to return (default 100)
+            ttl_seconds: How long a result may be reused
+
+        Returns:
+            Same as execute_query
+        """
+        key = (query, tuple(sorted(params.items())) if params else (), max_rows)
+        now = time.monotonic()
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+        if cached is not None and now - cached[0] <= ttl_seconds:
+            return cached[1]
+
+        result = self.execute_query(query, params, max_rows=max_rows)
+        if result.get("success"):
+            with self._result_cache_lock:
+                self._result_cache.pop(key, None)
+                if len(self._result_cache) >= RESULT_CACHE_SIZE:
+                    del self._result_cache[next(iter(self._result_cache))]
+                self._result_cache[key] = (now, result)
+        return result
+
     def get_table_schema(self, table_name: str) -> dict[str, Any]:
         """Get schema information for a table."""
         return self.execute_query(f"DESCRIBE TABLE {table_name}", max_rows=50)
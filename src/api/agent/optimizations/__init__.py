@@ -5,13 +5,16 @@ Provides caching, history pruning, and result truncation to reduce
 token usage and improve response times.
 """
 
-from .cache import QueryCache, SemanticCache
+from .cache import QueryCache, RedisSemanticCache, SemanticCache
+from .embeddings import LocalEmbedder
 from .history import ConversationHistoryManager
 from .truncation import truncate_tool_result
 
 __all__ = [
     "QueryCache",
     "SemanticCache",
+    "RedisSemanticCache",
+    "LocalEmbedder",
     "ConversationHistoryManager",
     "truncate_tool_result",
 ]
@@ -4,19 +4,50 @@ Caching utilities for query responses.
 Implements:
 1. QueryCache - Exact match caching for repeated queries
 2. SemanticCache - Similarity-based caching using embeddings
+3. RedisSemanticCache - SemanticCache shared across processes via Redis
 """
 
 import hashlib
+import math
 import time
 import logging
+from array import array
+from itertools import islice
 from typing import Optional
 from dataclasses import dataclass
-from collections import OrderedDict
+
+# Optional vector backends for SemanticCache: FAISS, then NumPy, then pure Python
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+# Optional shared backend for RedisSemanticCache (Redis Stack / Azure
+# Managed Redis with the RediSearch module)
+try:
+    import redis
+except ImportError:
+    redis = None
 
 logger = logging.getLogger(__name__)
 
+# Memoized query -> cache key normalizations kept by QueryCache
+NORMALIZE_CACHE_SIZE = 1024
+
+# SemanticCache size at which int8 quantized embeddings are used by default
+QUANTIZE_MIN_ENTRIES = 1000
+
+# Share of a full SemanticCache evicted at once when the vector index
+# compacts its storage on every removal (FAISS)
+EVICTION_BATCH_FRACTION = 0.1
 
-@dataclass
+
+@dataclass(slots=True)
 class CacheEntry:
     """A cached query response."""
     query: str
@@ -26,6 +57,18 @@ class CacheEntry:
     hit_count: int = 0
 
 
+class _Node:
+    """Link in QueryCache's circular doubly linked LRU list."""
+
+    __slots__ = ("prev", "next", "key", "entry")
+
+    def __init__(self, key=None, entry=None):
+        self.prev = self
+        self.next = self
+        self.key = key
+        self.entry = entry
+
+
 class QueryCache:
     """
     Exact-match query cache with TTL and LRU eviction.
@@ -54,17 +97,58 @@ class QueryCache:
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        # Same layout as functools.lru_cache: key -> node, with the nodes
+        # threaded on a circular list. root.next is LRU, root.prev is MRU.
+        self._cache: dict[str, _Node] = {}
+        self._root = _Node()
+        # Raw query -> normalized key; agent loops look up the same text
+        # repeatedly (get, then set), so normalize it once
+        self._norm_cache: dict[str, str] = {}
         self._stats = {"hits": 0, "misses": 0}
 
+    def _unlink(self, node: _Node):
+        """Detach a node from the LRU list."""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+
+    def _link_mru(self, node: _Node):
+        """Insert a node at the most-recently-used end (just before root)."""
+        root = self._root
+        last = root.prev
+        last.next = node
+        node.prev = last
+        node.next = root
+        root.prev = node
+
+    def _delete(self, key: str):
+        """Remove a key from both the dict and the LRU list."""
+        self._unlink(self._cache.pop(key))
+
     def _normalize_query(self, query: str) -> str:
-        """Normalize query for cache key."""
-        return query.strip().lower()
+        """
+        Normalize query for cache key.
+
+        Casefolds (Unicode-aware lower()), collapses whitespace and drops
+        trailing "?", "." and "!", so "YoY revenue?" and "yoy  revenue"
+        share an entry. A query of only punctuation keeps it.
+        """
+        normalized = " ".join(query.casefold().split())
+        return normalized.rstrip("?.!").rstrip() or normalized
 
     def _make_key(self, query: str) -> str:
-        """Create cache key from query."""
-        normalized = self._normalize_query(query)
-        return hashlib.md5(normalized.encode()).hexdigest()
+        """
+        Create cache key from query.
+
+        The normalized string is the key itself; dict lookups already hash
+        it, so a separate digest would only add cost.
+        """
+        key = self._norm_cache.get(query)
+        if key is None:
+            key = self._normalize_query(query)
+            if len(self._norm_cache) >= NORMALIZE_CACHE_SIZE:
+                del self._norm_cache[next(iter(self._norm_cache))]
+            self._norm_cache[query] = key
+        return key
 
     def get(self, query: str) -> Optional[CacheEntry]:
         """
@@ -78,21 +162,24 @@ class QueryCache:
         """
         key = self._make_key(query)
 
-        if key not in self._cache:
+        node = self._cache.get(key)
+        if node is None:
             self._stats["misses"] += 1
             return None
 
-        entry = self._cache[key]
+        entry = node.entry
 
         # Check TTL
         if time.time() - entry.created_at > self.ttl_seconds:
-            del self._cache[key]
+            self._delete(key)
             self._stats["misses"] += 1
             logger.debug(f"Cache entry expired for query: {query[:50]}...")
             return None
 
-        # Move to end (LRU)
-        self._cache.move_to_end(key)
+        # Move to MRU end (LRU), unless it is already there
+        if node is not self._root.prev:
+            self._unlink(node)
+            self._link_mru(node)
         entry.hit_count += 1
         self._stats["hits"] += 1
 
@@ -110,29 +197,35 @@ class QueryCache:
         """
         key = self._make_key(query)
 
-        # Evict oldest if at capacity
-        while len(self._cache) >= self.max_size:
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
+        # Replacing an existing key should not evict another entry
+        if key in self._cache:
+            self._delete(key)
+
+        # Evict least recently used if at capacity
+        while self._cache and len(self._cache) >= self.max_size:
+            self._delete(self._root.next.key)
             logger.debug("Evicted oldest cache entry")
 
-        self._cache[key] = CacheEntry(
+        node = _Node(key, CacheEntry(
             query=query,
             response=response,
             skill_name=skill_name,
             created_at=time.time()
-        )
+        ))
+        self._cache[key] = node
+        self._link_mru(node)
         logger.debug(f"Cached response for query: {query[:50]}...")
 
     def invalidate(self, query: str):
         """Remove a specific query from cache."""
         key = self._make_key(query)
         if key in self._cache:
-            del self._cache[key]
+            self._delete(key)
 
     def clear(self):
         """Clear all cache entries."""
         self._cache.clear()
+        self._root.prev = self._root.next = self._root
         logger.info("Query cache cleared")
 
     def get_stats(self) -> dict:
@@ -148,12 +241,174 @@ class QueryCache:
         }
 
 
+class _LinearVectorIndex:
+    """
+    Pure-Python cosine similarity scan.
+
+    Fallback for SemanticCache when neither FAISS nor NumPy is installed.
+    Vectors are normalized once at insert time, so each comparison is a
+    plain dot product.
+    """
+
+    backend = "linear"
+    evict_in_batches = False
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self._vectors: dict[int, list[float]] = {}
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> list[float]:
+        """Scale a vector to unit length (zero vectors are returned as-is)."""
+        norm = math.sqrt(sum(x * x for x in embedding))
+        if norm == 0:
+            return list(embedding)
+        return [x / norm for x in embedding]
+
+    def add(self, entry_id: int, embedding: list[float]):
+        self._vectors[entry_id] = self._normalize(embedding)
+
+    def remove(self, entry_ids: list[int]):
+        for entry_id in entry_ids:
+            self._vectors.pop(entry_id, None)
+
+    def search(self, embedding: list[float]) -> tuple[Optional[int], float]:
+        """Return (entry_id, similarity) of the closest vector."""
+        query = self._normalize(embedding)
+        best_id = None
+        best_similarity = 0.0
+        for entry_id, vector in self._vectors.items():
+            similarity = sum(x * y for x, y in zip(query, vector))
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_id = entry_id
+        return best_id, best_similarity
+
+
+class _NumpyVectorIndex:
+    """
+    NumPy matrix of L2-normalized embeddings, used as a ring buffer.
+
+    Rows are normalized at insert time, so a lookup is a single
+    matrix-vector product (one BLAS call) followed by argmax.
+
+    SemanticCache ids are consecutive and always evicted oldest-first, so
+    the live ids span at most `capacity` consecutive values and row
+    `id % capacity` is free whenever an id is added. Eviction just clears
+    the row's alive flag; nothing is shifted or reallocated.
+    """
+
+    backend = "numpy"
+    evict_in_batches = False
+
+    def __init__(self, dim: int, capacity: int):
+        self.dim = dim
+        self.capacity = capacity
+        self._matrix = np.zeros((capacity, dim), dtype=np.float32)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._ids = np.zeros(capacity, dtype=np.int64)
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> "np.ndarray":
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector = vector / norm
+        return vector
+
+    def add(self, entry_id: int, embedding: list[float]):
+        slot = entry_id % self.capacity
+        self._matrix[slot] = self._normalize(embedding)
+        self._ids[slot] = entry_id
+        self._alive[slot] = True
+
+    def remove(self, entry_ids: list[int]):
+        self._alive[np.asarray(entry_ids, dtype=np.int64) % self.capacity] = False
+
+    def search(self, embedding: list[float]) -> tuple[Optional[int], float]:
+        """Return (entry_id, similarity) of the closest vector."""
+        if not self._alive.any():
+            return None, 0.0
+
+        similarities = self._matrix @ self._normalize(embedding)
+        similarities[~self._alive] = -np.inf
+        best = int(similarities.argmax())
+        return int(self._ids[best]), float(similarities[best])
+
+
+class _FaissVectorIndex:
+    """
+    FAISS inner-product index over L2-normalized embeddings.
+
+    Inner product of unit vectors is cosine similarity, so a lookup is a
+    single BLAS pass over a contiguous float32 matrix. IndexIDMap2 lets
+    evicted entries be removed by id.
+
+    With quantize=True vectors are stored as int8 codes (4x smaller) in a
+    scalar-quantizer index. Unit vectors lie in [-1, 1], so a fixed scale of
+    127 needs no training pass.
+
+    remove_ids() compacts the whole code array, O(N * dim) per call
+    whatever the number of ids, so SemanticCache evicts in batches.
+    """
+
+    _INT8_SCALE = 127.0
+    evict_in_batches = True
+
+    def __init__(self, dim: int, quantize: bool = False):
+        self.dim = dim
+        self.quantize = quantize
+        if quantize:
+            base = faiss.IndexScalarQuantizer(
+                dim,
+                faiss.ScalarQuantizer.QT_8bit_direct_signed,
+                faiss.METRIC_INNER_PRODUCT
+            )
+        else:
+            base = faiss.IndexFlatIP(dim)
+        self._index = faiss.IndexIDMap2(base)
+
+    @property
+    def backend(self) -> str:
+        return "faiss-int8" if self.quantize else "faiss"
+
+    def _normalize(self, embedding: list[float]) -> "np.ndarray":
+        vector = np.asarray([embedding], dtype=np.float32)
+        faiss.normalize_L2(vector)
+        if self.quantize:
+            vector = np.round(vector * self._INT8_SCALE)
+        return vector
+
+    def add(self, entry_id: int, embedding: list[float]):
+        self._index.add_with_ids(
+            self._normalize(embedding),
+            np.asarray([entry_id], dtype=np.int64)
+        )
+
+    def remove(self, entry_ids: list[int]):
+        self._index.remove_ids(np.asarray(entry_ids, dtype=np.int64))
+
+    def search(self, embedding: list[float]) -> tuple[Optional[int], float]:
+        """Return (entry_id, similarity) of the closest vector."""
+        if self._index.ntotal == 0:
+            return None, 0.0
+
+        scores, ids = self._index.search(self._normalize(embedding), 1)
+        if ids[0, 0] < 0:
+            return None, 0.0
+        similarity = float(scores[0, 0])
+        if self.quantize:
+            similarity /= self._INT8_SCALE * self._INT8_SCALE
+        return int(ids[0, 0]), similarity
+
+
 class SemanticCache:
     """
     Semantic similarity cache using embeddings.
 
     Caches responses and finds similar queries using cosine similarity.
-    Falls back to QueryCache if embeddings unavailable.
+    Embeddings are held in a FAISS index when faiss-cpu is installed,
+    otherwise in a NumPy matrix, with a pure-Python scan as last resort.
 
     Usage:
         cache = SemanticCache(similarity_threshold=0.92)
@@ -171,7 +426,8 @@ class SemanticCache:
         self,
         similarity_threshold: float = 0.92,
         max_size: int = 200,
-        ttl_seconds: int = 7200
+        ttl_seconds: int = 7200,
+        quantize: Optional[bool] = None
     ):
         """
         Initialize semantic cache.
@@ -180,26 +436,57 @@ class SemanticCache:
             similarity_threshold: Minimum similarity for cache hit (0-1)
             max_size: Maximum entries
             ttl_seconds: Time-to-live (default 2 hours)
+            quantize: Store embeddings as int8 codes. None (default) enables
+                it automatically for caches of QUANTIZE_MIN_ENTRIES or more.
         """
         self.similarity_threshold = similarity_threshold
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self._entries: list[dict] = []
+        if quantize is None:
+            quantize = max_size >= QUANTIZE_MIN_ENTRIES
+        self.quantize = quantize
+        # Entries keyed by index id, in insertion (oldest-first) order
+        self._entries: dict[int, CacheEntry] = {}
+        self._next_id = 0
+        # Earliest time any entry can expire (oldest created_at + ttl)
+        self._next_expiry_at = float("inf")
+        # Vector index is created lazily once the embedding dimension is known
+        self._index = None
         self._stats = {"hits": 0, "misses": 0, "similarity_scores": []}
 
-    def _cosine_similarity(self, a: list[float], b: list[float]) -> float:
-        """Compute cosine similarity between two vectors."""
-        if len(a) != len(b):
-            return 0.0
-
-        dot_product = sum(x * y for x, y in zip(a, b))
-        magnitude_a = sum(x * x for x in a) ** 0.5
-        magnitude_b = sum(x * x for x in b) ** 0.5
-
-        if magnitude_a == 0 or magnitude_b == 0:
-            return 0.0
-
-        return dot_product / (magnitude_a * magnitude_b)
+    def _create_index(self, dim: int):
+        """Create the best available vector index for the given dimension."""
+        if faiss is not None:
+            return _FaissVectorIndex(dim, quantize=self.quantize)
+        if np is not None:
+            return _NumpyVectorIndex(dim, capacity=self.max_size)
+        return _LinearVectorIndex(dim)
+
+    def _update_next_expiry(self):
+        """Recompute when the oldest entry expires."""
+        if self._entries:
+            oldest = next(iter(self._entries.values()))
+            self._next_expiry_at = oldest.created_at + self.ttl_seconds
+        else:
+            self._next_expiry_at = float("inf")
+
+    def _remove_entries(self, entry_ids: list[int]):
+        """Drop entries from both the metadata map and the vector index."""
+        if not entry_ids:
+            return
+        for entry_id in entry_ids:
+            del self._entries[entry_id]
+        self._index.remove(entry_ids)
+        self._update_next_expiry()
+
+    def _remove_expired(self, current_time: float):
+        """Remove expired entries (entries are ordered oldest first)."""
+        expired = []
+        for entry_id, entry in self._entries.items():
+            if current_time - entry.created_at <= self.ttl_seconds:
+                break
+            expired.append(entry_id)
+        self._remove_entries(expired)
 
     def get_similar(
         self,
@@ -211,34 +498,28 @@ class SemanticCache:
 
         Args:
             query: The user's query
-            query_embedding: Embedding vector for the query
+            query_embedding: Embedding vector for the query (list or numpy array)
 
         Returns:
             CacheEntry if similar query found, None otherwise
         """
-        if not self._entries or not query_embedding:
+        if not self._entries or query_embedding is None or len(query_embedding) == 0:
             self._stats["misses"] += 1
             return None
 
+        # Sweep only once the oldest entry has actually expired; otherwise
+        # the read path costs a single comparison
         current_time = time.time()
+        if current_time > self._next_expiry_at:
+            self._remove_expired(current_time)
+
         best_match = None
         best_similarity = 0.0
 
-        # Find most similar non-expired entry
-        valid_entries = []
-        for entry in self._entries:
-            # Skip expired
-            if current_time - entry["created_at"] > self.ttl_seconds:
-                continue
-            valid_entries.append(entry)
-
-            similarity = self._cosine_similarity(query_embedding, entry["embedding"])
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = entry
-
-        # Update entries list (remove expired)
-        self._entries = valid_entries
+        # Find most similar entry
+        if self._entries and len(query_embedding) == self._index.dim:
+            entry_id, best_similarity = self._index.search(query_embedding)
+            best_match = self._entries.get(entry_id)
 
         # Track similarity scores for tuning
         if best_similarity > 0:
@@ -252,13 +533,8 @@ class SemanticCache:
                 f"Semantic cache hit (similarity: {best_similarity:.3f}) "
                 f"for query: {query[:50]}..."
             )
-            return CacheEntry(
-                query=best_match["query"],
-                response=best_match["response"],
-                skill_name=best_match.get("skill_name"),
-                created_at=best_match["created_at"],
-                hit_count=best_match.get("hit_count", 0) + 1
-            )
+            best_match.hit_count += 1
+            return best_match
 
         self._stats["misses"] += 1
         if best_similarity > 0:
@@ -284,23 +560,46 @@ class SemanticCache:
             embedding: Query embedding vector
             skill_name: Optional skill name
         """
-        # Evict oldest if at capacity
-        while len(self._entries) >= self.max_size:
-            self._entries.pop(0)
-
-        self._entries.append({
-            "query": query,
-            "response": response,
-            "embedding": embedding,
-            "skill_name": skill_name,
-            "created_at": time.time(),
-            "hit_count": 0
-        })
+        if embedding is None or len(embedding) == 0:
+            return
+
+        if self._index is None or len(embedding) != self._index.dim:
+            if self._index is not None:
+                logger.warning(
+                    f"Embedding dimension changed ({self._index.dim} -> {len(embedding)}), "
+                    "resetting semantic cache"
+                )
+                self._entries.clear()
+                self._next_expiry_at = float("inf")
+            self._index = self._create_index(len(embedding))
+
+        # Evict oldest if at capacity. Removal from the ring-buffer
+        # indexes is O(1); a FAISS removal compacts the whole index, so
+        # its cost is spread over EVICTION_BATCH_FRACTION of the entries
+        if len(self._entries) >= self.max_size:
+            count = len(self._entries) - self.max_size + 1
+            if self._index.evict_in_batches:
+                count = max(count, math.ceil(self.max_size * EVICTION_BATCH_FRACTION))
+            self._remove_entries(list(islice(self._entries, count)))
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._index.add(entry_id, embedding)
+        self._entries[entry_id] = CacheEntry(
+            query=query,
+            response=response,
+            skill_name=skill_name,
+            created_at=time.time()
+        )
+        if len(self._entries) == 1:
+            self._update_next_expiry()
         logger.debug(f"Semantic cached response for query: {query[:50]}...")
 
     def clear(self):
         """Clear all entries."""
         self._entries.clear()
+        self._index = None
+        self._next_expiry_at = float("inf")
         logger.info("Semantic cache cleared")
 
     def get_stats(self) -> dict:
@@ -318,5 +617,198 @@ class SemanticCache:
             "misses": self._stats["misses"],
             "hit_rate": f"{hit_rate:.1%}",
             "avg_similarity": f"{avg_similarity:.3f}",
-            "threshold": self.similarity_threshold
+            "threshold": self.similarity_threshold,
+            "backend": self._index.backend if self._index else None
+        }
+
+
+class RedisSemanticCache:
+    """
+    Semantic similarity cache stored in Redis with a RediSearch vector index.
+
+    Same get_similar/set interface as SemanticCache, but entries live in
+    Redis hashes, so every worker process and replica shares one warm cache
+    and it survives restarts. Similar queries are found with a KNN query on
+    an HNSW index (cosine distance); expiry is left to Redis key TTLs.
+
+    Redis errors are logged and treated as cache misses, so an unreachable
+    Redis never fails a chat turn.
+
+    Usage:
+        cache = RedisSemanticCache("redis://localhost:6379", similarity_threshold=0.92)
+        cached = cache.get_similar(query, embedding)
+    """
+
+    backend = "redis"
+
+    def __init__(
+        self,
+        url: str,
+        similarity_threshold: float = 0.92,
+        ttl_seconds: int = 7200,
+        index_name: str = "stihl_cache_idx",
+        key_prefix: str = "stihl:cache:"
+    ):
+        """
+        Initialize the Redis semantic cache.
+
+        Args:
+            url: Redis connection URL (rediss:// for Azure Managed Redis)
+            similarity_threshold: Minimum similarity for cache hit (0-1)
+            ttl_seconds: Time-to-live of each entry (default 2 hours)
+            index_name: RediSearch index name
+            key_prefix: Prefix of the hash keys covered by the index
+        """
+        if redis is None:
+            raise ImportError("RedisSemanticCache requires the redis package: pip install redis")
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.index_name = index_name
+        self.key_prefix = key_prefix
+        # Embeddings are binary, so responses are decoded by hand
+        self._redis = redis.Redis.from_url(url)
+        # Index is created lazily once the embedding dimension is known
+        self._index_dim: Optional[int] = None
+        self._stats = {"hits": 0, "misses": 0, "errors": 0}
+
+    @staticmethod
+    def _to_blob(embedding) -> bytes:
+        """Pack an embedding as the FLOAT32 blob RediSearch expects."""
+        return array("f", (float(x) for x in embedding)).tobytes()
+
+    def _ensure_index(self, dim: int):
+        """Create the vector index unless it already exists (e.g. from another worker)."""
+        if self._index_dim == dim:
+            return
+        try:
+            self._redis.execute_command(
+                "FT.CREATE", self.index_name,
+                "ON", "HASH", "PREFIX", 1, self.key_prefix,
+                "SCHEMA", "embedding", "VECTOR", "HNSW", 6,
+                "TYPE", "FLOAT32", "DIM", dim, "DISTANCE_METRIC", "COSINE"
+            )
+        except redis.ResponseError as e:
+            if "already exists" not in str(e).lower():
+                raise
+        self._index_dim = dim
+
+    def get_similar(self, query: str, query_embedding) -> Optional[CacheEntry]:
+        """
+        Find a cached response for a semantically similar query.
+
+        Args:
+            query: The user's query
+            query_embedding: Embedding vector for the query (list or numpy array)
+
+        Returns:
+            CacheEntry if similar query found, None otherwise
+        """
+        if query_embedding is None or len(query_embedding) == 0:
+            self._stats["misses"] += 1
+            return None
+
+        try:
+            self._ensure_index(len(query_embedding))
+            reply = self._redis.execute_command(
+                "FT.SEARCH", self.index_name, "*=>[KNN 1 @embedding $v AS score]",
+                "PARAMS", 2, "v", self._to_blob(query_embedding),
+                "RETURN", 5, "query", "response", "skill_name", "created_at", "score",
+                "DIALECT", 2
+            )
+        except redis.RedisError as e:
+            self._stats["errors"] += 1
+            self._stats["misses"] += 1
+            logger.warning(f"Redis semantic cache lookup failed: {e}")
+            return None
+
+        # [total, key, [field, value, ...]]
+        if len(reply) < 3:
+            self._stats["misses"] += 1
+            return None
+        values = reply[2]
+        fields = {
+            values[i].decode(): values[i + 1].decode()
+            for i in range(0, len(values), 2)
+        }
+        similarity = 1.0 - float(fields.get("score", 1.0))
+
+        if similarity < self.similarity_threshold:
+            self._stats["misses"] += 1
+            logger.debug(
+                f"Semantic cache miss (best similarity: {similarity:.3f}, "
+                f"threshold: {self.similarity_threshold})"
+            )
+            return None
+
+        self._stats["hits"] += 1
+        logger.info(
+            f"Semantic cache hit (similarity: {similarity:.3f}) "
+            f"for query: {query[:50]}..."
+        )
+        return CacheEntry(
+            query=fields.get("query", ""),
+            response=fields.get("response", ""),
+            skill_name=fields.get("skill_name") or None,
+            created_at=float(fields.get("created_at", 0.0))
+        )
+
+    def set(
+        self,
+        query: str,
+        response: str,
+        embedding,
+        skill_name: Optional[str] = None
+    ):
+        """
+        Cache a response with its embedding.
+
+        Args:
+            query: The user's query
+            response: The agent's response
+            embedding: Query embedding vector
+            skill_name: Optional skill name
+        """
+        if embedding is None or len(embedding) == 0:
+            return
+
+        key = self.key_prefix + hashlib.sha256(query.encode()).hexdigest()
+        try:
+            self._ensure_index(len(embedding))
+            # One round trip for the write and its expiry
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.hset(key, mapping={
+                "embedding": self._to_blob(embedding),
+                "query": query,
+                "response": response,
+                "skill_name": skill_name or "",
+                "created_at": time.time(),
+            })
+            pipe.expire(key, self.ttl_seconds)
+            pipe.execute()
+        except redis.RedisError as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Redis semantic cache write failed: {e}")
+            return
+        logger.debug(f"Semantic cached response for query: {query[:50]}...")
+
+    def clear(self):
+        """Drop the index together with all cached entries."""
+        try:
+            self._redis.execute_command("FT.DROPINDEX", self.index_name, "DD")
+        except redis.RedisError as e:
+            logger.warning(f"Redis semantic cache clear failed: {e}")
+        self._index_dim = None
+        logger.info("Semantic cache cleared")
+
+    def get_stats(self) -> dict:
+        """Get cache statistics (hit counts are per process)."""
+        total = self._stats["hits"] + self._stats["misses"]
+        hit_rate = self._stats["hits"] / total if total > 0 else 0
+        return {
+            "hits": self._stats["hits"],
+            "misses": self._stats["misses"],
+            "errors": self._stats["errors"],
+            "hit_rate": f"{hit_rate:.1%}",
+            "threshold": self.similarity_threshold,
+            "backend": self.backend
         }
@@ -0,0 +1,123 @@
+"""
+On-device query embeddings for the semantic cache.
+
+Embedding every query through the Azure OpenAI API puts a network round
+trip on the hot path of each cache lookup. LocalEmbedder runs a small
+sentence-transformers model on CPU instead and memoizes results per query
+text, so repeated queries are never re-embedded.
+
+sentence-transformers is optional (it pulls in torch, so it is not part of
+requirements.txt): pip install sentence-transformers
+"""
+
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 384-dim MiniLM model (~80 MB), fast enough for per-query CPU inference
+DEFAULT_LOCAL_MODEL = "all-MiniLM-L6-v2"
+
+
+class LocalEmbedder:
+    """
+    Memoizing wrapper around a local sentence-transformers model.
+
+    Usage:
+        embedder = LocalEmbedder()
+        embedding = embedder.embed(query)  # float32 ndarray, or None
+        if embedding is not None:
+            cached = semantic_cache.get_similar(query, embedding)
+    """
+
+    def __init__(self, model_name: str = DEFAULT_LOCAL_MODEL, cache_size: int = 1024):
+        """
+        Initialize the embedder. The model is loaded on first use.
+
+        Args:
+            model_name: sentence-transformers model name or path
+            cache_size: Maximum memoized query embeddings
+        """
+        self.model_name = model_name
+        self.cache_size = cache_size
+        # Loaded lazily; False once loading has failed
+        self._model = None
+        # query text -> embedding, bounded FIFO
+        self._cache: dict = {}
+
+    def _get_model(self):
+        """Load the model once; None if sentence-transformers is unavailable."""
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._model = SentenceTransformer(self.model_name, device="cpu")
+                logger.info(f"Loaded local embedding model: {self.model_name}")
+            except (ImportError, OSError) as e:
+                # Missing package or model download failure
+                logger.warning(f"Local embedding model unavailable: {e}")
+                self._model = False
+        return self._model or None
+
+    @property
+    def available(self) -> bool:
+        """Whether the local model can be used."""
+        return self._get_model() is not None
+
+    def embed(self, text: str):
+        """
+        Embed a single query.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            L2-normalized float32 numpy vector, or None if the model is unavailable
+        """
+        cached = self._cache.get(text)
+        if cached is not None:
+            return cached
+
+        model = self._get_model()
+        if model is None:
+            return None
+
+        embedding = model.encode(
+            text,
+            normalize_embeddings=True,
+            convert_to_numpy=True
+        )
+        self._remember(text, embedding)
+        return embedding
+
+    def embed_batch(self, texts: list[str]) -> Optional[list]:
+        """
+        Embed several queries in one model call (memoized ones are skipped).
+
+        Returns:
+            Embeddings in input order, or None if the model is unavailable
+        """
+        found = {text: self._cache[text] for text in texts if text in self._cache}
+        missing = [text for text in dict.fromkeys(texts) if text not in found]
+        if missing:
+            model = self._get_model()
+            if model is None:
+                return None
+            embeddings = model.encode(
+                missing,
+                normalize_embeddings=True,
+                convert_to_numpy=True
+            )
+            for text, embedding in zip(missing, embeddings):
+                found[text] = embedding
+                self._remember(text, embedding)
+        return [found[text] for text in texts]
+
+    def _remember(self, text: str, embedding):
+        """Memoize an embedding, evicting the oldest when full."""
+        if len(self._cache) >= self.cache_size:
+            del self._cache[next(iter(self._cache))]
+        self._cache[text] = embedding
+
+    def clear(self):
+        """Drop memoized embeddings."""
+        self._cache.clear()
@@ -10,14 +10,24 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# tiktoken encoding used by the gpt-4o / gpt-5 model families
+TOKEN_ENCODING = "o200k_base"
 
-@dataclass
+# Maximum memoized truncations kept per manager
+SUMMARY_CACHE_SIZE = 256
+
+# Maximum memoized per-text token counts kept per manager
+TOKEN_COUNT_CACHE_SIZE = 512
+
+
+@dataclass(slots=True)
 class HistoryConfig:
     """Configuration for conversation history management."""
     max_turns: int = 10  # Maximum conversation turns to keep
     summarize_after: int = 5  # Summarize turns older than this
     max_tool_result_tokens: int = 500  # Max tokens per tool result
     preserve_system_prompt: bool = True  # Always keep system prompt
+    keep_last_tool_turns: int = 2  # Turns whose tool calls/results are sent in full
 
 
 class ConversationHistoryManager:
@@ -28,7 +38,8 @@ class ConversationHistoryManager:
     1. Keeps last N turns in full detail
     2. Summarizes older turns to reduce tokens
     3. Truncates long tool results
-    4. Maintains context while reducing size
+    4. Collapses tool calls/results of earlier turns into a short note
+    5. Maintains context while reducing size
 
     Usage:
         manager = ConversationHistoryManager(max_turns=10)
@@ -48,68 +59,81 @@ class ConversationHistoryManager:
             config: History configuration (uses defaults if None)
         """
         self.config = config or HistoryConfig()
-        self._summary_cache: dict[str, str] = {}
+        # (content, max_tokens) -> truncated content, bounded FIFO
+        self._summary_cache: dict[tuple[str, int], str] = {}
+        # text -> tiktoken token count, bounded FIFO; the system prompt and
+        # earlier messages are counted again on every stats call otherwise
+        self._token_counts: dict[str, int] = {}
+        # tiktoken encoder, loaded on first use (False if unavailable)
+        self._encoder = None
+
+    def _get_encoder(self):
+        """Load the tiktoken encoder once; None means use the char heuristic."""
+        if self._encoder is None:
+            try:
+                import tiktoken
+                self._encoder = tiktoken.get_encoding(TOKEN_ENCODING)
+            except (ImportError, OSError, ValueError) as e:
+                # Missing package, BPE file download failure or bad cached file
+                logger.warning(f"tiktoken unavailable, estimating 4 chars per token: {e}")
+                self._encoder = False
+        return self._encoder or None
 
     def _count_turns(self, history: list[dict]) -> int:
         """Count user/assistant turn pairs in history."""
         user_messages = sum(1 for m in history if m.get("role") == "user")
         return user_messages
 
-    def _estimate_tokens(self, text: str) -> int:
-        """Rough token estimate (4 chars per token)."""
-        return len(text) // 4
+    def _estimate_tokens_batch(self, texts: list[str]) -> int:
+        """Total token count for several texts, encoding uncounted ones in one call."""
+        encoder = self._get_encoder()
+        if encoder is None:
+            return sum(len(text) for text in texts) // 4
+        found = {text: self._token_counts[text] for text in texts if text in self._token_counts}
+        missing = [text for text in dict.fromkeys(texts) if text not in found]
+        if missing:
+            encoded = encoder.encode_batch(missing, disallowed_special=())
+            for text, tokens in zip(missing, encoded):
+                found[text] = len(tokens)
+                self._remember_token_count(text, len(tokens))
+        return sum(found[text] for text in texts)
+
+    def _remember_token_count(self, text: str, count: int):
+        """Memoize a token count, evicting the oldest when full."""
+        if len(self._token_counts) >= TOKEN_COUNT_CACHE_SIZE:
+            del self._token_counts[next(iter(self._token_counts))]
+        self._token_counts[text] = count
 
     def _truncate_content(self, content: str, max_tokens: int) -> str:
-        """Truncate content to approximate token limit."""
-        max_chars = max_tokens * 4
-        if len(content) <= max_chars:
+        """Truncate content to a token limit."""
+        # A token is at least one character, so short content always fits
+        if len(content) <= max_tokens:
             return content
-        return content[:max_chars - 20] + "... [truncated]"
 
-    def _summarize_message(self, message: dict) -> dict:
-        """
-        Create a summarized version of a message.
-
-        Keeps the essential information while reducing size.
-        """
-        role = message.get("role", "")
-        content = message.get("content", "")
-
-        if role == "system":
-            # Never summarize system prompts
-            return message
-
-        if role == "tool":
-            # Heavily summarize tool results
-            return {
-                "role": "tool",
-                "tool_call_id": message.get("tool_call_id", ""),
-                "content": self._truncate_content(content, 150)
-            }
-
-        if role == "assistant" and message.get("tool_calls"):
-            # Keep tool calls but summarize content
-            return {
-                "role": "assistant",
-                "content": self._truncate_content(content or "", 100) if content else None,
-                "tool_calls": message["tool_calls"]
-            }
-
-        if role == "user":
-            # Keep user messages mostly intact (they're usually short)
-            return {
-                "role": "user",
-                "content": self._truncate_content(content, 200)
-            }
-
-        if role == "assistant":
-            # Summarize long assistant responses
-            return {
-                "role": "assistant",
-                "content": self._truncate_content(content, 300)
-            }
+        # The same tool results are re-truncated on every turn
+        cache_key = (content, max_tokens)
+        cached = self._summary_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        encoder = self._get_encoder()
+        if encoder is None:
+            max_chars = max_tokens * 4
+            if len(content) <= max_chars:
+                truncated = content
+            else:
+                truncated = content[:max_chars - 20] + "... [truncated]"
+        else:
+            tokens = encoder.encode(content, disallowed_special=())
+            if len(tokens) <= max_tokens:
+                truncated = content
+            else:
+                truncated = encoder.decode(tokens[:max_tokens - 5]) + "... [truncated]"
 
-        return message
+        if len(self._summary_cache) >= SUMMARY_CACHE_SIZE:
+            del self._summary_cache[next(iter(self._summary_cache))]
+        self._summary_cache[cache_key] = truncated
+        return truncated
 
     def optimize(self, history: list[dict]) -> list[dict]:
         """
@@ -124,50 +148,54 @@ class ConversationHistoryManager:
         if not history:
             return history
 
-        turns = self._count_turns(history)
-        if turns <= self.config.max_turns:
-            # Still within limits, just truncate tool results
-            return self._truncate_tool_results(history)
-
-        logger.info(f"Optimizing history: {turns} turns -> {self.config.max_turns}")
-
-        optimized = []
-        messages_to_summarize = []
-        recent_start_idx = None
-
-        # Find where recent (full-detail) messages start
-        user_count = 0
+        # Single reverse pass: count turns and find where the recent
+        # (full-detail) window and the tool-detail window start
+        turns = 0
+        recent_start_idx = 0
+        tool_start_idx = 0
         for i in range(len(history) - 1, -1, -1):
             if history[i].get("role") == "user":
-                user_count += 1
-                if user_count == self.config.summarize_after:
+                turns += 1
+                if turns == self.config.summarize_after:
                     recent_start_idx = i
-                    break
+                if turns == self.config.keep_last_tool_turns:
+                    tool_start_idx = i
 
-        if recent_start_idx is None:
+        if turns <= self.config.max_turns:
+            # Still within limits - keep everything, just truncate tool results
             recent_start_idx = 0
+        else:
+            logger.info(f"Optimizing history: {turns} turns -> {self.config.max_turns}")
+
+        optimized = []
+        messages_to_summarize = []
 
         # Process messages
         for i, message in enumerate(history):
-            if message.get("role") == "system":
+            role = message.get("role")
+            if role == "system":
                 # Always keep system prompt
                 optimized.append(message)
             elif i < recent_start_idx:
                 # Summarize older messages
                 messages_to_summarize.append(message)
-            else:
+            elif i < tool_start_idx and (role == "tool" or message.get("tool_calls")):
+                # Earlier turns' tool exchanges: the answer that followed
+                # them is kept, the raw results are dropped
+                if role != "tool":
+                    optimized.append(self._collapse_tool_calls(message))
+            elif role == "tool":
                 # Keep recent messages with truncated tool results
-                if message.get("role") == "tool":
-                    optimized.append({
-                        "role": "tool",
-                        "tool_call_id": message.get("tool_call_id", ""),
-                        "content": self._truncate_content(
-                            message.get("content", ""),
-                            self.config.max_tool_result_tokens
-                        )
-                    })
-                else:
-                    optimized.append(message)
+                optimized.append({
+                    "role": "tool",
+                    "tool_call_id": message.get("tool_call_id", ""),
+                    "content": self._truncate_content(
+                        message.get("content", ""),
+                        self.config.max_tool_result_tokens
+                    )
+                })
+            else:
+                optimized.append(message)
 
         # Add summary of older messages if any
         if messages_to_summarize:
@@ -181,22 +209,15 @@ class ConversationHistoryManager:
 
         return optimized
 
-    def _truncate_tool_results(self, history: list[dict]) -> list[dict]:
-        """Truncate just the tool results without other optimizations."""
-        result = []
-        for message in history:
-            if message.get("role") == "tool":
-                result.append({
-                    "role": "tool",
-                    "tool_call_id": message.get("tool_call_id", ""),
-                    "content": self._truncate_content(
-                        message.get("content", ""),
-                        self.config.max_tool_result_tokens
-                    )
-                })
-            else:
-                result.append(message)
-        return result
+    def _collapse_tool_calls(self, message: dict) -> dict:
+        """Replace an assistant tool-call message with a note naming the tools."""
+        names = ", ".join(call["function"]["name"] for call in message["tool_calls"])
+        note = f"[Used tools: {names}; results omitted]"
+        content = message.get("content")
+        return {
+            "role": "assistant",
+            "content": f"{content}\n{note}" if content else note
+        }
 
     def _create_summary(self, messages: list[dict]) -> str:
         """
@@ -247,21 +268,36 @@ class ConversationHistoryManager:
         if history and history[0].get("role") == "system":
             system_prompt = history[0]
             rest = history[1:]
-            pruned = rest[-(max_messages - 1):]
+            pruned = self._drop_orphaned_tool_results(rest[-(max_messages - 1):])
             return [system_prompt] + pruned
 
-        return history[-max_messages:]
+        return self._drop_orphaned_tool_results(history[-max_messages:])
+
+    def _drop_orphaned_tool_results(self, messages: list[dict]) -> list[dict]:
+        """
+        Drop leading tool results whose assistant tool_calls were pruned.
+
+        The API rejects a tool message that does not follow the assistant
+        message requesting it, so a cut inside a tool-call group would break
+        every later request.
+        """
+        start = 0
+        while start < len(messages) and messages[start].get("role") == "tool":
+            start += 1
+        return messages[start:] if start else messages
 
     def get_stats(self, history: list[dict]) -> dict:
         """Get statistics about the conversation history."""
-        total_chars = sum(len(m.get("content", "") or "") for m in history)
-        tool_results = [m for m in history if m.get("role") == "tool"]
-        tool_chars = sum(len(m.get("content", "")) for m in tool_results)
+        contents = [m.get("content", "") or "" for m in history]
+        tool_contents = [
+            content for m, content in zip(history, contents)
+            if m.get("role") == "tool"
+        ]
 
         return {
             "message_count": len(history),
             "turn_count": self._count_turns(history),
-            "estimated_tokens": total_chars // 4,
-            "tool_result_count": len(tool_results),
-            "tool_result_tokens": tool_chars // 4
+            "estimated_tokens": self._estimate_tokens_batch(contents),
+            "tool_result_count": len(tool_contents),
+            "tool_result_tokens": self._estimate_tokens_batch(tool_contents)
         }
@@ -7,13 +7,22 @@ preserving essential information like product names and key metrics.
 
 import json
 import logging
-from typing import Any, Union
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is used otherwise
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 # Increased limit to preserve important data (~500 tokens)
 MAX_RESULT_CHARS = 2000
 
+# tiktoken encoding used by the gpt-4o / gpt-5 model families
+TOKEN_ENCODING = "o200k_base"
+
 # Keys that should NEVER be truncated (product identifiers, names, etc.)
 CRITICAL_KEYS = [
     "product_name", "product_id", "name", "id", "sku",
@@ -33,13 +42,101 @@ SUMMARY_KEYS = [
     "total_revenue", "total_units", "insight_count",
     "total_products", "critical_count", "warning_count",
     "total_transactions", "periods",
+    # Result size, so a cut-down result still says how much there was
+    "row_count", "has_more", "record_count",
 ]
 
+# Union of the above, built once for O(1) membership checks
+DEFAULT_PRESERVE_KEYS = frozenset(CRITICAL_KEYS) | frozenset(SUMMARY_KEYS)
+
+# Known query_sales_data result shapes. A result whose query_type and
+# columns match is projected onto its fields by a schema truncator instead
+# of the generic recursive walker. Other tools reuse some query_type names
+# with different columns, so both must match.
+RESULT_SCHEMAS = {
+    "top_products": {
+        "fields": ["product_name", "category", "revenue", "units_sold", "transaction_count"],
+        "max_items": 8,
+    },
+    "top_dealers": {
+        "fields": ["dealer_name", "region", "state", "revenue", "units_sold", "transaction_count"],
+        "max_items": 8,
+    },
+    "trend": {
+        "fields": ["year", "month", "revenue", "units", "transactions"],
+        "max_items": 8,
+    },
+    "by_category": {
+        "fields": ["category", "revenue", "units_sold", "transactions", "pct_of_total"],
+        "max_items": 8,
+    },
+    "by_region": {
+        "fields": ["region", "revenue", "units_sold", "transactions", "pct_of_total"],
+        "max_items": 8,
+    },
+}
+
+# Top-level fields of an execute_query result kept by schema truncators
+RESULT_FIELDS = ("success", "query_type", "row_count", "has_more", "note", "filters_applied")
+
+# Budget reserved for the {"items", "total_count", "showing"} wrapper
+# around a cut-down row list
+ROWS_WRAPPER_CHARS = 60
+
+# tiktoken encoder, loaded on first use (False if unavailable)
+_encoder = None
+
+
+def _get_encoder():
+    """Load the tiktoken encoder once; None means token budgets are skipped."""
+    global _encoder
+    if _encoder is None:
+        try:
+            import tiktoken
+            _encoder = tiktoken.get_encoding(TOKEN_ENCODING)
+        except (ImportError, OSError, ValueError) as e:
+            # Missing package, BPE file download failure or bad cached file
+            logger.warning(f"tiktoken unavailable, tool results bounded by chars only: {e}")
+            _encoder = False
+    return _encoder or None
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _dumps(value: Any) -> str:
+    """Serialize to compact JSON, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, default=str, separators=(",", ":"))
+
+
+def _clip_to_json(output: str, max_chars: int) -> str:
+    """
+    Cut an oversized JSON document down to a valid JSON preview.
+
+    Slicing the serialized text directly would leave unbalanced braces and
+    quotes, so the prefix is re-wrapped as a string field instead.
+    """
+    preview_len = max_chars - 50
+    while preview_len > 0:
+        clipped = _dumps({"preview": output[:preview_len], "_truncated": True})
+        if len(clipped) <= max_chars:
+            return clipped
+        # Escaped quotes grow the preview; shrink by the overshoot and retry
+        preview_len -= len(clipped) - max_chars
+    return _dumps({"_truncated": True})
+
 
 def truncate_tool_result(
-    result: Union[str, dict, list],
+    result: str | dict | list,
     max_chars: int = MAX_RESULT_CHARS,
-    preserve_keys: list[str] = None
+    preserve_keys: list[str] | None = None,
+    max_tokens: int | None = None
 ) -> str:
     """
     Truncate a tool result while preserving essential information.
@@ -53,44 +150,171 @@ def truncate_tool_result(
         result: The tool result (JSON string or parsed)
         max_chars: Maximum characters in output (default 2000)
         preserve_keys: Additional keys to preserve in full
+        max_tokens: Optional token budget (needs tiktoken). Digit-heavy
+            JSON packs fewer chars per token than prose, so an output over
+            budget is truncated again with a proportionally smaller
+            char limit, keeping it valid JSON.
 
     Returns:
         Truncated JSON string
     """
-    all_preserve_keys = CRITICAL_KEYS + SUMMARY_KEYS
+    output = _truncate_to_chars(result, max_chars, preserve_keys)
+    # A token is at least one character, so short output always fits
+    if max_tokens is None or len(output) <= max_tokens:
+        return output
+    encoder = _get_encoder()
+    if encoder is None:
+        return output
+
+    # Chars per token vary across a result, so re-count after each shrink.
+    # Structure (leading rows, counts) is kept while it still shrinks; once
+    # it cannot, the output is clipped to a preview as a last resort. The
+    # char budget strictly decreases, so this always ends.
+    char_budget = len(output)
+    tokens = len(encoder.encode(output, disallowed_special=()))
+    while tokens > max_tokens:
+        char_budget = min(char_budget - 1, len(output) * max_tokens // tokens)
+        if char_budget <= 0:
+            break
+        shrunk = _truncate_to_chars(result, char_budget, preserve_keys, clip=False)
+        if len(shrunk) >= len(output):
+            shrunk = _clip_to_json(output, char_budget)
+        output = shrunk
+        tokens = len(encoder.encode(output, disallowed_special=()))
+    return output
+
+
+def _truncate_to_chars(
+    result: str | dict | list,
+    max_chars: int,
+    preserve_keys: list[str] | None,
+    clip: bool = True
+) -> str:
+    """
+    Structural truncation of a tool result to a character budget.
+
+    With clip=False an output the structure cannot bring under max_chars
+    is returned as-is instead of being cut to a preview.
+    """
+    # Most tool results are small - skip parsing them entirely
+    if isinstance(result, str) and len(result) <= max_chars // 2:
+        return result
+
+    all_preserve_keys = DEFAULT_PRESERVE_KEYS
     if preserve_keys:
-        all_preserve_keys = list(set(all_preserve_keys + preserve_keys))
+        all_preserve_keys = DEFAULT_PRESERVE_KEYS | frozenset(preserve_keys)
 
     # Parse if string
     if isinstance(result, str):
         try:
-            data = json.loads(result)
-        except json.JSONDecodeError:
+            data = _loads(result)
+        except ValueError:
             # Plain string - just truncate
             if len(result) <= max_chars:
                 return result
             return result[:max_chars - 20] + "... [truncated]"
     else:
+        # Already-parsed results that fit need no walk, just one serialize
+        output = _dumps(result)
+        if len(output) <= max_chars:
+            return output
         data = result
 
-    # Truncate based on type
-    truncated = _truncate_value(data, max_chars, all_preserve_keys, depth=0)
-
-    # Convert back to JSON
-    output = json.dumps(truncated, default=str)
+    # Truncate based on type; known result shapes skip the generic walk
+    # unless their projection still does not fit
+    output = None
+    truncator = _get_schema_truncator(data) if isinstance(data, dict) else None
+    if truncator is not None:
+        output = _dumps(truncator(data, max_chars, all_preserve_keys))
+        if len(output) > max_chars:
+            output = None
+    if output is None:
+        output = _dumps(_truncate_value(data, max_chars, all_preserve_keys, depth=0))
 
     # Final safety truncation (but warn)
-    if len(output) > max_chars:
+    if clip and len(output) > max_chars:
         logger.warning(f"Tool result exceeded max_chars ({len(output)} > {max_chars})")
-        output = output[:max_chars - 50] + '... [truncated for length]"}'
+        output = _clip_to_json(output, max_chars)
 
     return output
 
 
+def _make_schema_truncator(schema: dict) -> Callable[[dict, int, frozenset[str]], dict]:
+    """
+    Build the truncator for one result schema.
+
+    Rows are projected onto the schema's fields, with long strings cut as
+    in the generic walk, and only as many leading rows as fit max_chars
+    are kept (at least one).
+    """
+    fields = tuple(schema["fields"])
+    max_items = schema["max_items"]
+
+    def truncate(data: dict, max_chars: int, preserve_keys: frozenset[str]) -> dict:
+        def project(row: dict) -> dict:
+            return {
+                field: _truncate_value(row.get(field), max_chars, preserve_keys, depth=2)
+                for field in fields
+            }
+        return _keep_leading_rows(data, project, max_chars, max_items)
+
+    return truncate
+
+
+def _keep_leading_rows(
+    data: dict,
+    project: Callable[[dict], Any],
+    max_chars: int,
+    max_items: int
+) -> dict:
+    """
+    Cut an execute_query result down to its leading rows.
+
+    Keeps RESULT_FIELDS (row_count, has_more, ...) and as many projected
+    leading rows as fit max_chars, at least one, so even a tight budget
+    leaves the start of the answer rather than just the counts.
+    """
+    result = {field: data[field] for field in RESULT_FIELDS if field in data}
+    budget = max_chars - len(_dumps(result)) - ROWS_WRAPPER_CHARS
+    rows = data["data"]
+    items = []
+    for row in rows[:max_items]:
+        item = project(row)
+        budget -= len(_dumps(item)) + 1
+        if budget < 0 and items:
+            break
+        items.append(item)
+    if len(items) < len(rows):
+        result["data"] = {"items": items, "total_count": len(rows), "showing": len(items)}
+    else:
+        result["data"] = items
+    return result
+
+
+def _is_row_set(value: Any) -> bool:
+    """Whether a value is an execute_query result (columns plus a row list)."""
+    return type(value) is dict and "columns" in value and type(value.get("data")) is list
+
+
+def _get_schema_truncator(data: dict) -> Callable[[dict, int, frozenset[str]], dict] | None:
+    """Return the truncator for a known result shape, else None."""
+    query_type = data.get("query_type")
+    if not isinstance(query_type, str):
+        return None
+    schema = RESULT_SCHEMAS.get(query_type)
+    if (
+        schema is None
+        or data.get("columns") != schema["fields"]
+        or not isinstance(data.get("data"), list)
+    ):
+        return None
+    return _SCHEMA_TRUNCATORS[query_type]
+
+
 def _truncate_value(
     value: Any,
     max_chars: int,
-    preserve_keys: list[str],
+    preserve_keys: frozenset[str],
     depth: int = 0
 ) -> Any:
     """Recursively truncate a value."""
@@ -99,6 +323,16 @@ def _truncate_value(
         # Too deep - summarize
         return "[nested data]"
 
+    # Parsed JSON only ever holds exact dict/list/str/scalar types, so one
+    # table lookup replaces the isinstance chain on the common path
+    handler = _HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value, max_chars, preserve_keys, depth)
+
+    if type(value) in _SCALAR_TYPES:
+        return value
+
+    # Subclasses (e.g. OrderedDict in already-parsed results)
     if isinstance(value, dict):
         return _truncate_dict(value, max_chars, preserve_keys, depth)
 
@@ -106,34 +340,59 @@ def _truncate_value(
         return _truncate_list(value, max_chars, preserve_keys, depth)
 
     if isinstance(value, str):
-        # More generous string limit
-        if len(value) > 300:
-            return value[:300] + "..."
-        return value
+        return _truncate_str(value, max_chars, preserve_keys, depth)
+
+    return value
+
 
+def _truncate_str(
+    value: str,
+    max_chars: int,
+    preserve_keys: frozenset[str],
+    depth: int
+) -> str:
+    """Truncate a long string."""
+    # More generous string limit
+    if len(value) > 300:
+        return value[:300] + "..."
     return value
 
 
 def _truncate_dict(
     data: dict,
     max_chars: int,
-    preserve_keys: list[str],
+    preserve_keys: frozenset[str],
     depth: int
 ) -> dict:
     """Truncate a dictionary while preserving critical keys."""
+    if _is_row_set(data):
+        return _keep_leading_rows(
+            data,
+            lambda row: _truncate_value(row, max_chars, preserve_keys, depth + 2),
+            max_chars,
+            max_items=8
+        )
+
     result = {}
     char_budget = max_chars
 
     # First pass: include ALL preserved/critical keys (never truncate these)
-    for key in preserve_keys:
-        if key in data:
-            value = data[key]
+    for key, value in data.items():
+        if key in preserve_keys:
             # Keep critical values intact (only truncate very long strings)
             if isinstance(value, str) and len(value) > 500:
                 value = value[:500] + "..."
             result[key] = value
             char_budget -= len(str(value)) + len(key) + 10
 
+    # Then nested query results: their leading rows are the answer, so
+    # they get the remaining budget before any other field
+    for key, value in data.items():
+        if key not in result and _is_row_set(value):
+            truncated_value = _truncate_value(value, char_budget, preserve_keys, depth + 1)
+            result[key] = truncated_value
+            char_budget -= len(str(truncated_value)) + len(key) + 10
+
     # Second pass: include other keys until budget exhausted
     for key, value in data.items():
         if key in result:
@@ -159,9 +418,9 @@ def _truncate_dict(
 def _truncate_list(
     data: list,
     max_chars: int,
-    preserve_keys: list[str],
+    preserve_keys: frozenset[str],
     depth: int
-) -> Union[list, dict]:
+) -> list | dict:
     """Truncate a list while keeping enough items for useful answers."""
     if not data:
         return []
@@ -195,7 +454,24 @@ def _truncate_list(
     return truncated
 
 
-def summarize_sql_result(result: str, query_type: str = None) -> str:
+# Type dispatch for _truncate_value
+_HANDLERS = {
+    dict: _truncate_dict,
+    list: _truncate_list,
+    str: _truncate_str,
+}
+
+# Values returned as-is without any further checks
+_SCALAR_TYPES = frozenset({int, float, bool, type(None)})
+
+# query_type -> truncator for the known result shapes
+_SCHEMA_TRUNCATORS = {
+    query_type: _make_schema_truncator(schema)
+    for query_type, schema in RESULT_SCHEMAS.items()
+}
+
+
+def summarize_sql_result(result: str, query_type: str | None = None) -> str:
     """
     Create a concise summary of SQL query results.
 
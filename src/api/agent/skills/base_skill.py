@@ -9,69 +9,233 @@ Skills encapsulate domain-specific capabilities with:
 This enables modular, testable, and extensible agent behavior.
 """
 import re
-from abc import ABC, abstractmethod
-from typing import Optional
-from dataclasses import dataclass, field
+import string
+from abc import ABC
+from functools import cached_property
+from typing import ClassVar, Optional
+from dataclasses import dataclass
 
+# Word tokenizer used for confidence scoring
+WORD_PATTERN = re.compile(r'\w+')
 
-@dataclass
+# Confidence scoring: base score plus one step per satisfied criterion
+BASE_CONFIDENCE = 0.7
+CONFIDENCE_STEP = 0.1
+LONG_PATTERN_CHARS = 30  # patterns longer than this count as specific
+
+# Characters that match themselves in a lowercase ASCII trigger
+LITERAL_CHARS = frozenset(string.ascii_lowercase + string.digits + " _-")
+
+# ASCII characters that Unicode str patterns treat differently from bytes
+# patterns (str \s also matches the \x1c-\x1f separators)
+STR_ONLY_ASCII = re.compile(r'[\x1c-\x1f]')
+
+# Class attributes every BaseSkill subclass must declare
+REQUIRED_ATTRIBUTES = ("name", "description", "triggers", "tools", "system_prompt")
+
+
+def _iter_structure(pattern: str):
+    """Yield (index, char, depth) for unescaped chars outside [...] classes."""
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+        else:
+            if char == ")":
+                depth -= 1
+            yield i, char, depth
+            if char == "(":
+                depth += 1
+        i += 1
+
+
+def _split_alternatives(pattern: str) -> list[str]:
+    """Split a pattern at its top-level "|" separators."""
+    branches = []
+    start = 0
+    for i, char, depth in _iter_structure(pattern):
+        if char == "|" and depth == 0:
+            branches.append(pattern[start:i])
+            start = i + 1
+    branches.append(pattern[start:])
+    return branches
+
+
+def _group_end(pattern: str, open_index: int) -> Optional[int]:
+    """Index of the ")" closing the group opened at open_index."""
+    for i, char, depth in _iter_structure(pattern):
+        if i > open_index and char == ")" and depth == 0:
+            return i
+    return None
+
+
+def _leading_literals(branch: str) -> Optional[frozenset[str]]:
+    """Required literals of one alternative, from its leading literal or group."""
+    start = 0
+    for anchor in ("^", r"\b"):
+        if branch.startswith(anchor, start):
+            start += len(anchor)
+
+    if branch.startswith("(", start):
+        body_start = start + 1
+        if branch.startswith("(?:", start):
+            body_start = start + 3
+        elif branch.startswith("(?", start):
+            # Lookarounds and inline flags
+            return None
+        end = _group_end(branch[start:], 0)
+        if end is None or branch[start + end + 1:start + end + 2] in ("?", "*", "{"):
+            # Unbalanced, or an optional group
+            return None
+        return _required_literals(branch[body_start:start + end])
+
+    end = start
+    while end < len(branch) and branch[end] in LITERAL_CHARS:
+        end += 1
+    literal = branch[start:end]
+    # A trailing ?, * or {m,n} can make the last literal char optional
+    if end < len(branch) and branch[end] in "?*{":
+        literal = literal[:-1]
+    return frozenset({literal}) if len(literal) >= 2 else None
+
+
+def _query_bytes(query_lower: str) -> Optional[bytes]:
+    """
+    Encode a query for the byte-string trigger patterns, if equivalent.
+
+    re matches bytes measurably faster than str. For ASCII text the two give
+    the same results, except that str \\s also matches \\x1c-\\x1f, so such
+    queries (and non-ASCII ones) return None and use the str patterns.
+    """
+    if query_lower.isascii() and not STR_ONLY_ASCII.search(query_lower):
+        return query_lower.encode("ascii")
+    return None
+
+
+def _required_literals(pattern: str) -> Optional[frozenset[str]]:
+    """
+    Return plain substrings of which every match must contain at least one.
+
+    Uses each alternative's leading literal or leading group, e.g.
+    r"\\bdealer" -> {"dealer"}, r"(top|best).*dealer" -> {"top", "best"}.
+    Returns None when some alternative has no such literal.
+    """
+    literals = set()
+    for branch in _split_alternatives(pattern):
+        branch_literals = _leading_literals(branch)
+        if branch_literals is None:
+            return None
+        literals |= branch_literals
+    return frozenset(literals)
+
+
+@dataclass(frozen=True, slots=True)
 class SkillMatch:
-    """Result of matching a query against a skill."""
+    """Result of matching a query against a skill (shared by the route cache)."""
     skill_name: str
     confidence: float  # 0.0 to 1.0
     matched_pattern: Optional[str] = None
-    tools_available: list[str] = field(default_factory=list)
+    tools_available: tuple[str, ...] = ()
 
 
 class BaseSkill(ABC):
     """
     Abstract base class for all agent skills.
     
-    Each skill defines:
+    Each skill declares, as class attributes:
     - name: Unique identifier
     - description: What this skill does
     - triggers: Regex patterns that activate this skill
     - tools: List of tool names this skill can use
     - system_prompt: Skill-specific prompt enhancement
+    - priority: Routing priority (higher = checked first, default 10)
     """
-    
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Unique skill identifier."""
-        pass
-    
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Human-readable description of skill capabilities."""
-        pass
-    
-    @property
-    @abstractmethod
-    def triggers(self) -> list[str]:
-        """Regex patterns that trigger this skill."""
-        pass
-    
-    @property
-    @abstractmethod
-    def tools(self) -> list[str]:
-        """List of tool names this skill can use."""
-        pass
-    
-    @property
-    @abstractmethod
-    def system_prompt(self) -> str:
-        """Skill-specific system prompt enhancement."""
-        pass
-    
-    @property
-    def priority(self) -> int:
+
+    name: ClassVar[str]
+    description: ClassVar[str]
+    triggers: ClassVar[list[str]]
+    tools: ClassVar[list[str]]
+    system_prompt: ClassVar[str]
+    priority: ClassVar[int] = 10
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        missing = [attr for attr in REQUIRED_ATTRIBUTES if not hasattr(cls, attr)]
+        if missing:
+            raise TypeError(f"{cls.__name__} must define {', '.join(missing)}")
+
+    @cached_property
+    def _compiled_triggers(self) -> list[re.Pattern]:
+        """Trigger patterns compiled once per skill instance."""
+        return [re.compile(pattern, re.IGNORECASE) for pattern in self.triggers]
+
+    @cached_property
+    def _compiled_ascii_triggers(self) -> Optional[list[re.Pattern]]:
+        """Byte-string trigger patterns (see _query_bytes); None if any is non-ASCII."""
+        if not all(pattern.isascii() for pattern in self.triggers):
+            return None
+        return [
+            re.compile(pattern.encode("ascii"), re.IGNORECASE)
+            for pattern in self.triggers
+        ]
+
+    @cached_property
+    def _trigger_literals(self) -> list[Optional[frozenset[str]]]:
+        """Per-trigger required literals (see _required_literals), or None."""
+        return [_required_literals(pattern) for pattern in self.triggers]
+
+    @cached_property
+    def _pattern_keywords(self) -> dict[str, frozenset[str]]:
+        """Word set of each trigger, for confidence scoring."""
+        return {
+            pattern: frozenset(WORD_PATTERN.findall(pattern.lower()))
+            for pattern in self.triggers
+        }
+
+    @cached_property
+    def max_confidence(self) -> float:
+        """
+        Highest confidence matches() can return for this skill.
+
+        SkillRouter uses it to stop evaluating lower-priority skills early.
+        Override together with _calculate_confidence.
+        """
+        return max(
+            (
+                min(
+                    BASE_CONFIDENCE
+                    + CONFIDENCE_STEP * (len(pattern) > LONG_PATTERN_CHARS)
+                    + CONFIDENCE_STEP * (len(keywords) >= 2)
+                    + CONFIDENCE_STEP * (len(keywords) >= 3),
+                    1.0
+                )
+                for pattern, keywords in self._pattern_keywords.items()
+            ),
+            default=0.0
+        )
+
+    @cached_property
+    def required_literals(self) -> frozenset[str]:
+        """Every literal that some trigger of this skill requires."""
+        return frozenset().union(*(lits for lits in self._trigger_literals if lits))
+
+    def warm_up(self):
         """
-        Skill priority for routing (higher = checked first).
-        Override in subclass if needed. Default is 10.
+        Compile triggers and extract their literals now instead of on the
+        first routed query. SkillRouter calls this when a skill is registered.
         """
-        return 10
+        # Reading a cached_property computes and stores it
+        for attr in ("_compiled_triggers", "_compiled_ascii_triggers", "required_literals"):
+            getattr(self, attr)
     
     def matches(self, query: str) -> Optional[SkillMatch]:
         """
@@ -84,16 +248,58 @@ class BaseSkill(ABC):
             SkillMatch if triggered, None otherwise
         """
         query_lower = query.lower()
-        
-        for pattern in self.triggers:
-            if re.search(pattern, query_lower, re.IGNORECASE):
+        present_literals = None
+        if query_lower.isascii():
+            present_literals = {lit for lit in self.required_literals if lit in query_lower}
+        return self._match(query_lower, present_literals, _query_bytes(query_lower))
+
+    def _match(
+        self,
+        query_lower: str,
+        present_literals: Optional[set[str]],
+        query_bytes: Optional[bytes] = None
+    ) -> Optional[SkillMatch]:
+        """
+        Match an already-lowercased query.
+
+        Args:
+            query_lower: Lowercased query
+            present_literals: Trigger literals that occur in the query (at
+                least this skill's), or None to run every trigger regex.
+                SkillRouter computes this once for all skills.
+            query_bytes: The query from _query_bytes, to search with the
+                byte-string patterns, or None to search query_lower
+        """
+        # Triggers are searched one by one on purpose: the first trigger in
+        # list order must win, and a single "a|b|c" alternation measured
+        # slower with Python's re (it tries every alternative at each
+        # position instead of each pattern's own fast scan).
+        # A trigger none of whose required literals occur cannot match, and a
+        # set check is far cheaper than a regex search. (Unicode case folding
+        # can match e.g. "ſ" to "s", so non-ASCII queries pass None and
+        # always run the regexes.)
+        compiled_triggers = self._compiled_triggers
+        subject = query_lower
+        if query_bytes is not None and self._compiled_ascii_triggers is not None:
+            compiled_triggers = self._compiled_ascii_triggers
+            subject = query_bytes
+        for pattern, literals, compiled in zip(
+            self.triggers, self._trigger_literals, compiled_triggers
+        ):
+            if (
+                present_literals is not None
+                and literals is not None
+                and literals.isdisjoint(present_literals)
+            ):
+                continue
+            if compiled.search(subject):
                 # Calculate confidence based on pattern specificity
                 confidence = self._calculate_confidence(pattern, query_lower)
                 return SkillMatch(
                     skill_name=self.name,
                     confidence=confidence,
                     matched_pattern=pattern,
-                    tools_available=self.tools
+                    tools_available=self._tools_available
                 )
         
         return None
@@ -101,29 +307,30 @@ class BaseSkill(ABC):
     def _calculate_confidence(self, pattern: str, query: str) -> float:
         """
         Calculate confidence score based on pattern match quality.
+
+        The query is already lowercased by matches().
         
         Higher scores for:
         - Longer pattern matches
         - Multiple keyword matches
         - Exact phrase matches
         """
-        # Base confidence
-        confidence = 0.7
-        
-        # Boost for longer patterns (more specific)
-        if len(pattern) > 30:
-            confidence += 0.1
-        
         # Boost for multiple keywords in query matching pattern
-        pattern_keywords = re.findall(r'\w+', pattern.lower())
-        query_keywords = set(re.findall(r'\w+', query.lower()))
-        
-        keyword_overlap = len(set(pattern_keywords) & query_keywords)
-        if keyword_overlap >= 2:
-            confidence += 0.1
-        if keyword_overlap >= 3:
-            confidence += 0.1
+        pattern_keywords = self._pattern_keywords.get(pattern)
+        if pattern_keywords is None:
+            pattern_keywords = frozenset(WORD_PATTERN.findall(pattern.lower()))
+        query_keywords = WORD_PATTERN.findall(query)
         
+        keyword_overlap = len(pattern_keywords.intersection(query_keywords))
+
+        # Base confidence, boosted for longer (more specific) patterns and
+        # for 2+ and 3+ keyword overlaps; bools count as 0/1 steps
+        confidence = (
+            BASE_CONFIDENCE
+            + CONFIDENCE_STEP * (len(pattern) > LONG_PATTERN_CHARS)
+            + CONFIDENCE_STEP * (keyword_overlap >= 2)
+            + CONFIDENCE_STEP * (keyword_overlap >= 3)
+        )
         return min(confidence, 1.0)
     
     def get_enhanced_prompt(self, base_prompt: str) -> str:
@@ -136,7 +343,17 @@ class BaseSkill(ABC):
         Returns:
             Enhanced prompt with skill context
         """
-        return f"""{base_prompt}
+        return base_prompt + self._prompt_suffix
+
+    @cached_property
+    def _tools_available(self) -> tuple[str, ...]:
+        """Tool names as stored on SkillMatch (immutable, so shared)."""
+        return tuple(self.tools)
+
+    @cached_property
+    def _prompt_suffix(self) -> str:
+        """Skill section appended to the base prompt (static per skill)."""
+        return f"""
 
 ## Active Skill: {self.name}
 {self.system_prompt}
@@ -7,59 +7,54 @@ for low/critical stock items identified by the insights or inventory skills.
 import re
 from .base_skill import BaseSkill
 
+# Confidence tiers used by ReplenishmentSkill._calculate_confidence
+REPLENISH_KEYWORDS = re.compile(r'\b(replenish|restock|resupply)\b')
+CREATE_REQUEST = re.compile(r'(create|place|initiate|submit|make).*(shipment|order|request)')
+CONFIRM_REPLENISH = re.compile(r'(yes|ok|confirm|proceed|go ahead).*(replenish|restock|ship)')
+
 
 class ReplenishmentSkill(BaseSkill):
-    @property
-    def name(self) -> str:
-        return "replenishment_coordinator"
-
-    @property
-    def description(self) -> str:
-        return "Create and manage shipment requests to replenish inventory"
-
-    @property
-    def triggers(self) -> list[str]:
-        return [
-            # Simple direct matches - HIGHEST PRIORITY
-            r"^replenish\b",  # Starts with "replenish"
-            r"\breplenish\s+product\b",  # "replenish product"
-            r"\breplenish\s+\w+\s+for\b",  # "replenish X for"
-
-            # Confirmation patterns (user agreeing to replenish)
-            r"(yes|yeah|sure|ok|okay|confirm|confirmed|proceed|go ahead|do it|please do).*(replenish|restock|shipment|request|resupply|ship)",
-            r"(yes|yeah|sure|ok|okay|confirm|confirmed|proceed|go ahead|do it|please do).*(create|initiate|submit|make).*(request|order)",
-
-            # Direct action requests - expedited/urgent orders
-            r"(place|initiate|create|submit|make).*(expedited|urgent|emergency)?.*(shipment|request|replenish|restock|order)",
-            r"expedited.*(replenish|order|shipment)",
-            r"(replenish|restock|resupply).*(inventory|stock|product|order)",
-            r"(send|ship|transfer).*(product|inventory|stock|units).*to",
-
-            # Request management
-            r"(check|show|list|view).*(shipment|replenishment).*(request|order|status)",
-            r"pending.*(shipment|request|order)",
-
-            # Specific replenishment language
-            r"request.*shipment",
-            r"shipment.*request",
-            r"replenishment.*(request|order)",
-            r"restock.*order",
-
-            # Product-specific replenishment
-            r"(replenish|restock|order).*(for|product)",
-        ]
-
-    @property
-    def tools(self) -> list[str]:
-        return [
-            "create_shipment_request",
-            "get_shipment_requests",
-            "query_inventory_data"  # To verify current stock levels
-        ]
-
-    @property
-    def system_prompt(self) -> str:
-        return """You are a STIHL replenishment coordinator. Your ONLY job is to create shipment requests by calling tools.
+    name = "replenishment_coordinator"
+
+    description = "Create and manage shipment requests to replenish inventory"
+
+    triggers = [
+        # Simple direct matches - HIGHEST PRIORITY
+        r"^replenish\b",  # Starts with "replenish"
+        r"\breplenish\s+product\b",  # "replenish product"
+        r"\breplenish\s+\w+\s+for\b",  # "replenish X for"
+
+        # Confirmation patterns (user agreeing to replenish)
+        r"(yes|yeah|sure|ok|okay|confirm|confirmed|proceed|go ahead|do it|please do).*(replenish|restock|shipment|request|resupply|ship)",
+        r"(yes|yeah|sure|ok|okay|confirm|confirmed|proceed|go ahead|do it|please do).*(create|initiate|submit|make).*(request|order)",
+
+        # Direct action requests - expedited/urgent orders
+        r"(place|initiate|create|submit|make).*(expedited|urgent|emergency)?.*(shipment|request|replenish|restock|order)",
+        r"expedited.*(replenish|order|shipment)",
+        r"(replenish|restock|resupply).*(inventory|stock|product|order)",
+        r"(send|ship|transfer).*(product|inventory|stock|units).*to",
+
+        # Request management
+        r"(check|show|list|view).*(shipment|replenishment).*(request|order|status)",
+        r"pending.*(shipment|request|order)",
+
+        # Specific replenishment language
+        r"request.*shipment",
+        r"shipment.*request",
+        r"replenishment.*(request|order)",
+        r"restock.*order",
+
+        # Product-specific replenishment
+        r"(replenish|restock|order).*(for|product)",
+    ]
+
+    tools = [
+        "create_shipment_request",
+        "get_shipment_requests",
+        "query_inventory_data"  # To verify current stock levels
+    ]
+
+    system_prompt = """You are a STIHL replenishment coordinator. Your ONLY job is to create shipment requests by calling tools.
 
 ## CRITICAL: You MUST call create_shipment_request tool
 When the user asks to replenish/restock/order a product, you MUST:
@@ -117,30 +112,32 @@ DO NOT:
 
 JUST CALL THE TOOL AND CREATE THE REQUEST."""
 
-    @property
-    def priority(self) -> int:
-        # Highest priority (above InsightsSkill at 25) to ensure replenishment
-        # requests are handled immediately without interference
-        return 30
+    # Highest priority (above InsightsSkill at 25) to ensure replenishment
+    # requests are handled immediately without interference
+    priority = 30
+
+    # Highest tier returned by _calculate_confidence
+    max_confidence = 0.95
 
     def _calculate_confidence(self, pattern: str, query: str) -> float:
         """
         Override confidence calculation to ensure replenishment requests
         beat product pattern matches (which get 0.80 for product codes).
-        """
-        query_lower = query.lower()
 
+        The tiers are checked from highest score down, so the order is
+        fixed; the query is already lowercased by matches().
+        """
         # HIGH confidence (0.95) for explicit replenishment keywords
         # This beats product_expert's 0.80 for product codes like "FS 111 R"
-        if re.search(r'\b(replenish|restock|resupply)\b', query_lower):
+        if REPLENISH_KEYWORDS.search(query):
             return 0.95
 
         # HIGH confidence for shipment/order creation requests
-        if re.search(r'(create|place|initiate|submit|make).*(shipment|order|request)', query_lower):
+        if CREATE_REQUEST.search(query):
             return 0.90
 
         # MEDIUM-HIGH confidence for confirmations with replenishment context
-        if re.search(r'(yes|ok|confirm|proceed|go ahead).*(replenish|restock|ship)', query_lower):
+        if CONFIRM_REPLENISH.search(query):
             return 0.90
 
         # Default base confidence
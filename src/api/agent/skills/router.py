@@ -10,8 +10,9 @@ Routing Strategy:
 3. Return best match or None (falls back to general agent)
 """
 import logging
+from functools import lru_cache
 from typing import Optional
-from .base_skill import BaseSkill, SkillMatch
+from .base_skill import BaseSkill, SkillMatch, _query_bytes
 from .product_skill import ProductSkill
 from .sales_skill import SalesSkill
 from .inventory_skill import InventorySkill
@@ -23,6 +24,9 @@ from .replenishment_skill import ReplenishmentSkill
 
 logger = logging.getLogger(__name__)
 
+# Distinct lowercased queries whose routing result is memoized
+ROUTE_CACHE_SIZE = 2048
+
 
 class SkillRouter:
     """
@@ -39,6 +43,15 @@ class SkillRouter:
     def __init__(self):
         """Initialize router with all available skills."""
         self._skills: dict[str, BaseSkill] = {}
+        # Routing is a pure function of the lowercased query for a fixed
+        # skill set, so repeated queries skip the trigger scan entirely
+        self._route_cached = lru_cache(maxsize=ROUTE_CACHE_SIZE)(self._route_uncached)
+        # Derived from the registered skills; rebuilt lazily after changes
+        self._literals: Optional[frozenset[str]] = None
+        self._sorted_skills: Optional[tuple[BaseSkill, ...]] = None
+        # _confidence_bounds[i]: highest confidence any of _sorted_skills[i:]
+        # can return
+        self._confidence_bounds: list[float] = []
         self._register_default_skills()
 
     def _register_default_skills(self):
@@ -63,6 +76,9 @@ class SkillRouter:
             skill: Skill instance to register
         """
         self._skills[skill.name] = skill
+        # At process start for the global router
+        skill.warm_up()
+        self._skills_changed()
         logger.debug(f"Registered skill: {skill.name}")
 
     def unregister(self, skill_name: str):
@@ -74,8 +90,38 @@ class SkillRouter:
         """
         if skill_name in self._skills:
             del self._skills[skill_name]
+            self._skills_changed()
             logger.debug(f"Unregistered skill: {skill_name}")
 
+    def _skills_changed(self):
+        """Drop everything derived from the registered skills."""
+        self._literals = None
+        self._sorted_skills = None
+        self._route_cached.cache_clear()
+
+    def _build_index(self):
+        """Sort skills by priority and precompute routing lookups."""
+        self._sorted_skills = tuple(sorted(
+            self._skills.values(),
+            key=lambda s: s.priority,
+            reverse=True
+        ))
+        self._literals = frozenset().union(
+            *(skill.required_literals for skill in self._sorted_skills)
+        )
+        # A skill whose every trigger requires a literal cannot match unless
+        # one of its literals occurs, so it can be skipped without a call
+        self._skill_gates = [
+            None if None in skill._trigger_literals else skill.required_literals
+            for skill in self._sorted_skills
+        ]
+        bounds = []
+        bound = 0.0
+        for skill in reversed(self._sorted_skills):
+            bound = max(bound, skill.max_confidence)
+            bounds.append(bound)
+        self._confidence_bounds = bounds[::-1]
+
     def get_skill(self, skill_name: str) -> Optional[BaseSkill]:
         """
         Get a skill by name.
@@ -89,13 +135,11 @@ class SkillRouter:
         return self._skills.get(skill_name)
 
     @property
-    def skills(self) -> list[BaseSkill]:
-        """Get all registered skills sorted by priority."""
-        return sorted(
-            self._skills.values(),
-            key=lambda s: s.priority,
-            reverse=True
-        )
+    def skills(self) -> tuple[BaseSkill, ...]:
+        """Get all registered skills sorted by priority (cached until skills change)."""
+        if self._sorted_skills is None:
+            self._build_index()
+        return self._sorted_skills
 
     def route(self, query: str) -> Optional[SkillMatch]:
         """
@@ -105,33 +149,98 @@ class SkillRouter:
             query: User's natural language query
 
         Returns:
-            SkillMatch with skill info, or None if no match
+            SkillMatch with skill info, or None if no match. Results are
+            cached per lowercased query and shared between calls.
         """
-        matches: list[SkillMatch] = []
+        return self._route_cached(query.lower())
 
-        # Check all skills for matches
-        for skill in self.skills:
-            match = skill.matches(query)
-            if match:
-                matches.append(match)
-                print(f"  📋 Matched: {skill.name} (confidence: {match.confidence:.2f}, priority: {skill.priority})")
-                logger.debug(f"Query matched {skill.name} with confidence {match.confidence}")
+    def _present_literals(self, query_lower: str) -> Optional[set[str]]:
+        """
+        Scan the query once for every skill's trigger literals.
 
-        if not matches:
-            logger.debug(f"No skill match for query: {query[:50]}...")
+        Each skill then only runs the regexes of triggers whose literals
+        occur. None (non-ASCII query) means every trigger regex runs.
+        """
+        if self._sorted_skills is None:
+            self._build_index()
+        if not query_lower.isascii():
             return None
+        return {lit for lit in self._literals if lit in query_lower}
 
-        # Sort by confidence (primary) and priority (secondary)
-        matches.sort(
-            key=lambda m: (m.confidence, self._skills[m.skill_name].priority),
-            reverse=True
-        )
+    def _route_uncached(self, query: str) -> Optional[SkillMatch]:
+        """Evaluate every skill against an already-lowercased query."""
+        best_match = self._pick_best(self._score_skills(query))
 
-        best_match = matches[0]
-        logger.info(f"Routed to {best_match.skill_name} (confidence: {best_match.confidence:.2f})")
+        if best_match is None:
+            logger.debug("No skill match for query: %.50s...", query)
+            return None
+
+        logger.info("Routed to %s (confidence: %.2f)", best_match.skill_name, best_match.confidence)
 
         return best_match
 
+    def _score_skills(
+        self,
+        query_lower: str,
+        stop_early: bool = True
+    ) -> list[tuple[BaseSkill, SkillMatch]]:
+        """
+        Match an already-lowercased query against the skills in priority order.
+
+        Args:
+            query_lower: Lowercased query
+            stop_early: Stop once no remaining skill can exceed the best
+                confidence so far (enough to pick the winner); False
+                collects every match, as explain_routing shows them all
+
+        Returns:
+            (skill, match) pairs in descending skill priority
+        """
+        if self._sorted_skills is None:
+            self._build_index()
+        scored: list[tuple[BaseSkill, SkillMatch]] = []
+        best_confidence = -1.0
+
+        present_literals = self._present_literals(query_lower)
+        query_bytes = _query_bytes(query_lower)
+
+        for skill, gate, bound in zip(
+            self._sorted_skills, self._skill_gates, self._confidence_bounds
+        ):
+            if stop_early and best_confidence >= bound:
+                break
+            if (
+                gate is not None
+                and present_literals is not None
+                and gate.isdisjoint(present_literals)
+            ):
+                continue
+            match = skill._match(query_lower, present_literals, query_bytes)
+            if match:
+                scored.append((skill, match))
+                best_confidence = max(best_confidence, match.confidence)
+                logger.debug(
+                    "Query matched %s (confidence: %.2f, priority: %d)",
+                    skill.name, match.confidence, skill.priority
+                )
+
+        return scored
+
+    @staticmethod
+    def _pick_best(scored: list[tuple[BaseSkill, SkillMatch]]) -> Optional[SkillMatch]:
+        """
+        Pick the highest confidence match from _score_skills.
+
+        Matches come in descending priority, so only a strictly higher
+        confidence can beat the current best; on a tie the earlier (higher
+        or equal priority) match wins.
+        """
+        best_match = None
+        for _, match in scored:
+            if best_match is None or match.confidence > best_match.confidence:
+                best_match = match
+        return best_match
+
     def route_with_fallback(self, query: str, fallback_skill: str = "sales_analyst") -> SkillMatch:
         """
         Route a query with a guaranteed fallback.
@@ -153,7 +262,7 @@ class SkillRouter:
             skill_name=fallback_skill,
             confidence=0.3,
             matched_pattern=None,
-            tools_available=fallback.tools if fallback else []
+            tools_available=fallback._tools_available if fallback else ()
         )
 
     def explain_routing(self, query: str) -> str:
@@ -168,11 +277,7 @@ class SkillRouter:
         """
         lines = [f"Query: {query}", ""]
 
-        matches = []
-        for skill in self.skills:
-            match = skill.matches(query)
-            if match:
-                matches.append((skill, match))
+        matches = self._score_skills(query.lower(), stop_early=False)
 
         if not matches:
             lines.append("❌ No skill matched this query")
@@ -184,8 +289,7 @@ class SkillRouter:
                 lines.append(f"    Pattern: {match.matched_pattern}")
                 lines.append(f"    Tools: {', '.join(match.tools_available)}")
 
-            best = max(matches, key=lambda x: (x[1].confidence, x[0].priority))
-            lines.append(f"\n✅ Selected: {best[0].name}")
+            lines.append(f"\n✅ Selected: {self._pick_best(matches).skill_name}")
 
         return "\n".join(lines)
 
@@ -13,6 +13,9 @@ Enhanced with:
 import json
 import logging
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 from openai import AzureOpenAI
 from dotenv import load_dotenv
@@ -30,7 +33,9 @@ from agent.skills import get_router, SkillMatch
 # Import optimizations
 from agent.optimizations import (
     QueryCache,
+    RedisSemanticCache,
     SemanticCache,
+    LocalEmbedder,
     ConversationHistoryManager,
     truncate_tool_result,
 )
@@ -73,6 +78,57 @@ For multiple products, make multiple tool calls (one per product).
 
 Lead with insights. Be specific with numbers. Execute actions when requested."""
 
+# Remote query embeddings memoized per agent
+EMBEDDING_CACHE_SIZE = 256
+
+# Tool calls from one model response executed at once; matches the
+# DatabricksClient connection pool size
+MAX_PARALLEL_TOOL_CALLS = 5
+
+# Tools without side effects. Repeating one of these with the same
+# arguments returns the same data, so duplicates within a response can
+# share one execution; anything not listed (e.g. create_shipment_request)
+# always runs once per call.
+READ_ONLY_TOOLS = frozenset({
+    "query_sales_data",
+    "query_inventory_data",
+    "get_proactive_insights",
+    "detect_anomalies_realtime",
+    "get_daily_briefing",
+    "search_products",
+    "compare_products",
+    "get_product_recommendations",
+    "query_dealer_data",
+    "get_sales_forecast",
+    "analyze_trends",
+    "get_shipment_requests",
+})
+
+# Core tools needed for most queries, offered alongside every skill's tools
+CORE_TOOLS = [
+    "query_sales_data",
+    "query_inventory_data",
+    "get_proactive_insights",
+    "get_daily_briefing",
+    "create_shipment_request",  # Always available for replenishment
+]
+
+
+@lru_cache(maxsize=4)
+def _get_openai_client(endpoint: str, api_key: str, api_version: str) -> AzureOpenAI:
+    """
+    Get a shared Azure OpenAI client per endpoint/key/version.
+
+    The client is thread-safe and owns an HTTP connection pool, so agents
+    created later reuse its open connections instead of paying a new
+    TCP + TLS handshake.
+    """
+    return AzureOpenAI(
+        azure_endpoint=endpoint,
+        api_key=api_key,
+        api_version=api_version,
+    )
+
 
 class STIHLAnalyticsAgent:
     """
@@ -89,7 +145,8 @@ class STIHLAnalyticsAgent:
         use_skill_routing: bool = True,
         use_caching: bool = True,
         use_semantic_cache: bool = True,
-        max_history_turns: int = 10
+        max_history_turns: int = 10,
+        use_local_embeddings: Optional[bool] = None
     ):
         """
         Initialize the Azure OpenAI client with optimizations.
@@ -99,11 +156,13 @@ class STIHLAnalyticsAgent:
             use_caching: Enable exact-match query caching
             use_semantic_cache: Enable semantic similarity caching
             max_history_turns: Maximum conversation turns to keep
+            use_local_embeddings: Embed cache queries on-device instead of via
+                Azure OpenAI (defaults to the USE_LOCAL_EMBEDDINGS env var)
         """
-        self.client = AzureOpenAI(
-            azure_endpoint=os.environ["AZURE_OPENAI_ENDPOINT"],
-            api_key=os.environ["AZURE_OPENAI_API_KEY"],
-            api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview"),
+        self.client = _get_openai_client(
+            os.environ["AZURE_OPENAI_ENDPOINT"],
+            os.environ["AZURE_OPENAI_API_KEY"],
+            os.getenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview"),
         )
         # Model deployment - defaults to gpt-5-mini (configurable via env var)
         self.deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT_GPT", "gpt-5-mini")
@@ -118,11 +177,16 @@ class STIHLAnalyticsAgent:
         self.query_cache = QueryCache(max_size=100, ttl_seconds=3600) if use_caching else None
 
         self.use_semantic_cache = use_semantic_cache
-        self.semantic_cache = SemanticCache(
-            similarity_threshold=0.92,
-            max_size=200,
-            ttl_seconds=7200
-        ) if use_semantic_cache else None
+        self.semantic_cache = self._create_semantic_cache() if use_semantic_cache else None
+
+        # On-device embeddings for the semantic cache (remote API otherwise)
+        if use_local_embeddings is None:
+            use_local_embeddings = os.getenv("USE_LOCAL_EMBEDDINGS", "false").lower() == "true"
+        self.local_embedder = (
+            LocalEmbedder() if use_semantic_cache and use_local_embeddings else None
+        )
+        # query text -> remote embedding, bounded FIFO
+        self._embeddings: dict[str, list[float]] = {}
 
         # History management
         self.history_manager = ConversationHistoryManager(
@@ -133,6 +197,9 @@ class STIHLAnalyticsAgent:
             )
         )
 
+        # Held for a whole chat() turn or reset
+        self._turn_lock = threading.Lock()
+
         # Initialize conversation
         self.conversation_history = [
             {"role": "system", "content": BASE_SYSTEM_PROMPT}
@@ -140,6 +207,10 @@ class STIHLAnalyticsAgent:
 
         # Track current skill
         self.current_skill: Optional[SkillMatch] = None
+        # skill name (None = no skill) -> compact tool definitions
+        self._skill_tools: dict[Optional[str], list[dict]] = {}
+        # skill name -> BASE_SYSTEM_PROMPT with the skill section appended
+        self._enhanced_prompts: dict[str, str] = {}
 
         # Stats tracking
         self._stats = {
@@ -153,26 +224,30 @@ class STIHLAnalyticsAgent:
         Get COMPACT tool definitions with balanced filtering.
 
         Uses compact definitions but provides enough tools for complex queries.
+        The list depends only on the skill, so it is built once per skill.
         """
-        # Core tools needed for most queries
-        core_tools = [
-            "query_sales_data",
-            "query_inventory_data",
-            "get_proactive_insights",
-            "get_daily_briefing",
-            "create_shipment_request",  # Always available for replenishment
-        ]
-
+        skill_name = skill_match.skill_name if skill_match else None
+        tools = self._skill_tools.get(skill_name)
+        if tools is None:
+            tools = self._build_tools_for_skill(skill_match)
+            self._skill_tools[skill_name] = tools
+        return tools
+
+    def _build_tools_for_skill(self, skill_match: Optional[SkillMatch]) -> list[dict]:
+        """Select the compact tool definitions for a skill (None = no skill)."""
         if not skill_match:
             # No skill matched - return core + product tools
-            all_tools = core_tools + ["search_products", "detect_anomalies_realtime"]
+            all_tools = CORE_TOOLS + ["search_products", "detect_anomalies_realtime"]
             return get_compact_tools(all_tools)
 
-        # Get skill-specific tools
-        skill_tools = set(skill_match.tools_available)
-
-        # Always include core tools + skill tools for flexibility
-        combined_tools = list(set(core_tools) | skill_tools)
+        # Always include core tools + skill tools for flexibility. Keep a
+        # fixed order (core first, then the skill's own order) rather than
+        # set order, which depends on per-process string hashing: Azure
+        # OpenAI caches prompts by exact prefix, and the tool definitions
+        # are part of that prefix.
+        combined_tools = CORE_TOOLS + [
+            name for name in skill_match.tools_available if name not in CORE_TOOLS
+        ]
 
         # Use compact definitions
         filtered = get_compact_tools(combined_tools)
@@ -189,28 +264,67 @@ class STIHLAnalyticsAgent:
         if not skill_match:
             return BASE_SYSTEM_PROMPT
 
-        return self.router.get_prompt_for_skill(skill_match.skill_name, BASE_SYSTEM_PROMPT)
+        prompt = self._enhanced_prompts.get(skill_match.skill_name)
+        if prompt is None:
+            prompt = self.router.get_prompt_for_skill(skill_match.skill_name, BASE_SYSTEM_PROMPT)
+            self._enhanced_prompts[skill_match.skill_name] = prompt
+        return prompt
 
     def _update_system_prompt(self, new_prompt: str):
         """Update the system prompt in conversation history."""
         if self.conversation_history and self.conversation_history[0]["role"] == "system":
-            self.conversation_history[0]["content"] = new_prompt
+            # Consecutive turns on the same skill keep the same prompt (the
+            # memoized string, so the comparison is an identity check)
+            if self.conversation_history[0]["content"] != new_prompt:
+                self.conversation_history[0]["content"] = new_prompt
         else:
             self.conversation_history.insert(0, {"role": "system", "content": new_prompt})
 
+    def _create_semantic_cache(self):
+        """
+        Create the semantic cache selected by STIHL_CACHE_BACKEND.
+
+        "redis" shares one cache across workers and replicas (REDIS_URL);
+        "memory" (default) keeps a per-process SemanticCache.
+        """
+        if os.getenv("STIHL_CACHE_BACKEND", "memory").lower() == "redis":
+            try:
+                return RedisSemanticCache(
+                    url=os.environ["REDIS_URL"],
+                    similarity_threshold=0.92,
+                    ttl_seconds=7200
+                )
+            except (ImportError, KeyError) as e:
+                logger.warning(f"Redis semantic cache unavailable, using in-memory cache: {e}")
+        return SemanticCache(
+            similarity_threshold=0.92,
+            max_size=200,
+            ttl_seconds=7200
+        )
+
     def _get_embedding(self, text: str) -> Optional[list[float]]:
         """Get embedding for semantic caching."""
         if not self.use_semantic_cache:
             return None
+        if self.local_embedder and self.local_embedder.available:
+            return self.local_embedder.embed(text)
+        # A cache miss embeds the same query again in _cache_response
+        embedding = self._embeddings.get(text)
+        if embedding is not None:
+            return embedding
         try:
             response = self.client.embeddings.create(
                 model=self.embedding_deployment,
                 input=text
             )
-            return response.data[0].embedding
         except Exception as e:
             logger.warning(f"Failed to get embedding: {e}")
             return None
+        embedding = response.data[0].embedding
+        if len(self._embeddings) >= EMBEDDING_CACHE_SIZE:
+            del self._embeddings[next(iter(self._embeddings))]
+        self._embeddings[text] = embedding
+        return embedding
 
     def _check_caches(self, query: str) -> Optional[str]:
         """
@@ -230,7 +344,7 @@ class STIHLAnalyticsAgent:
         # Check semantic cache
         if self.semantic_cache:
             embedding = self._get_embedding(query)
-            if embedding:
+            if embedding is not None:
                 cached = self.semantic_cache.get_similar(query, embedding)
                 if cached:
                     self._stats["cache_hits"] += 1
@@ -246,9 +360,125 @@ class STIHLAnalyticsAgent:
 
         if self.semantic_cache:
             embedding = self._get_embedding(query)
-            if embedding:
+            if embedding is not None:
                 self.semantic_cache.set(query, response, embedding, skill_name)
 
+    def _stream_completion(
+        self,
+        messages: list[dict],
+        tools: list[dict],
+        tool_choice: str,
+        executor: ThreadPoolExecutor
+    ) -> tuple[Optional[str], list[dict], list[Future]]:
+        """
+        Stream one chat completion, starting read-only tool calls early.
+
+        A read-only call starts as soon as a later call begins and its own
+        arguments parse as complete JSON, overlapping its query with the
+        rest of the stream. Every other call starts only after the stream
+        has ended cleanly, so a broken stream never leaves a side effect
+        (e.g. a shipment insert) that the history does not record.
+        Repeated read-only calls (same function and arguments) share one
+        execution.
+
+        Returns:
+            (content, tool_calls as API message dicts, futures of the
+            truncated tool results in call order)
+        """
+        stream = self.client.chat.completions.create(
+            model=self.deployment,
+            messages=messages,
+            tools=tools,
+            tool_choice=tool_choice,
+            stream=True,
+        )
+
+        content_parts: list[str] = []
+        tool_calls: list[dict] = []
+        # Per call: its result future, None until submitted
+        futures: list[Optional[Future]] = []
+        # (name, arguments) -> future, so duplicate reads run the query once
+        submitted: dict[tuple[str, str], Future] = {}
+
+        def submit(index: int):
+            tool_call = tool_calls[index]
+            function = tool_call["function"]
+            if function["name"] not in READ_ONLY_TOOLS:
+                futures[index] = executor.submit(self._run_tool_call, tool_call)
+                return
+            key = (function["name"], function["arguments"])
+            future = submitted.get(key)
+            if future is None:
+                future = submitted[key] = executor.submit(self._run_tool_call, tool_call)
+            futures[index] = future
+
+        def submit_complete_reads():
+            for index, tool_call in enumerate(tool_calls):
+                function = tool_call["function"]
+                if futures[index] is not None or function["name"] not in READ_ONLY_TOOLS:
+                    continue
+                try:
+                    json.loads(function["arguments"])
+                except ValueError:
+                    # Still streaming in (deltas of several calls can interleave)
+                    continue
+                submit(index)
+
+        for chunk in stream:
+            # Azure sends content-filter results as chunks without choices
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                content_parts.append(delta.content)
+            for call_delta in delta.tool_calls or ():
+                if call_delta.index == len(tool_calls):
+                    submit_complete_reads()
+                    tool_calls.append({
+                        "id": call_delta.id,
+                        "type": "function",
+                        "function": {"name": "", "arguments": ""},
+                    })
+                    futures.append(None)
+                function = tool_calls[call_delta.index]["function"]
+                if call_delta.function is not None:
+                    function["name"] += call_delta.function.name or ""
+                    function["arguments"] += call_delta.function.arguments or ""
+
+        # The response is complete: start everything else, in call order
+        for index, future in enumerate(futures):
+            if future is None:
+                submit(index)
+
+        content = "".join(content_parts) if content_parts else None
+        return content, tool_calls, futures
+
+    def _run_tool_call(self, tool_call: dict) -> str:
+        """Execute one tool call from the model and return its truncated result."""
+        function_name = tool_call["function"]["name"]
+        function_args = json.loads(tool_call["function"]["arguments"])
+
+        logger.debug("Tool call: %s with args: %s", function_name, function_args)
+
+        # Execute the function
+        tool_function = TOOL_FUNCTIONS.get(function_name)
+        if tool_function is None:
+            logger.warning(f"Unknown function: {function_name}")
+            result = json.dumps({"error": f"Unknown function: {function_name}"})
+        else:
+            try:
+                result = tool_function(**function_args)
+            except Exception as e:
+                logger.error(f"Tool error: {function_name} - {e}")
+                result = json.dumps({"error": str(e)})
+
+        # Optimization #2: Truncate tool results (balanced - preserve product names)
+        return truncate_tool_result(
+            result,
+            max_chars=2000,
+            max_tokens=self.history_manager.config.max_tool_result_tokens
+        )
+
     def chat(self, user_message: str, max_tool_calls: int = 5) -> str:
         """
         Send a message and get a response, with full optimization.
@@ -259,7 +489,15 @@ class STIHLAnalyticsAgent:
 
         Returns:
             The agent's final response
+
+        Turns are serialized: each one mutates the shared conversation
+        history, and callers may run them in worker threads.
         """
+        with self._turn_lock:
+            return self._chat(user_message, max_tool_calls)
+
+    def _chat(self, user_message: str, max_tool_calls: int) -> str:
+        """Run one turn of chat(); the caller holds _turn_lock."""
         self._stats["total_requests"] += 1
 
         # Optimization #5 & #6: Check caches first
@@ -287,7 +525,8 @@ class STIHLAnalyticsAgent:
 
         # Optimization #1: Get filtered compact tools
         tools = self._get_tools_for_skill(self.current_skill)
-        logger.debug(f"Using {len(tools)} tools: {[t['function']['name'] for t in tools]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Using %d tools: %s", len(tools), [t["function"]["name"] for t in tools])
 
         # Add user message
         self.conversation_history.append({"role": "user", "content": user_message})
@@ -310,68 +549,39 @@ class STIHLAnalyticsAgent:
             # Call Azure OpenAI with optimized history
             # Only force tool_choice on first iteration
             current_tool_choice = tool_choice if tool_call_count == 0 else "auto"
-            response = self.client.chat.completions.create(
-                model=self.deployment,
-                messages=optimized_history,
-                tools=tools,
-                tool_choice=current_tool_choice,
-            )
-
-            response_message = response.choices[0].message
+            # Tool calls are independent and mostly wait on Databricks, so
+            # read-only calls start once fully streamed in, while later
+            # calls are still being generated. Threads are only spawned
+            # once a call is submitted.
+            with ThreadPoolExecutor(max_workers=MAX_PARALLEL_TOOL_CALLS) as executor:
+                content, tool_calls, pending = self._stream_completion(
+                    optimized_history, tools, current_tool_choice, executor
+                )
+                results = [future.result() for future in pending]
 
             # Check if we're done
-            if not response_message.tool_calls:
-                final_response = response_message.content
+            if not tool_calls:
+                final_response = content
                 self.conversation_history.append({
                     "role": "assistant",
                     "content": final_response
                 })
                 break
 
-            # Process tool calls
-            self.conversation_history.append({
-                "role": "assistant",
-                "content": response_message.content,
-                "tool_calls": [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments
-                        }
-                    }
-                    for tc in response_message.tool_calls
-                ]
-            })
+            # Content is optional alongside tool_calls and usually empty
+            assistant_message = {"role": "assistant", "tool_calls": tool_calls}
+            if content:
+                assistant_message["content"] = content
+            self.conversation_history.append(assistant_message)
             # Also add to optimized history for this iteration
             optimized_history.append(self.conversation_history[-1])
 
-            # Execute each tool call
-            for tool_call in response_message.tool_calls:
-                function_name = tool_call.function.name
-                function_args = json.loads(tool_call.function.arguments)
-
-                logger.debug(f"Tool call: {function_name} with args: {function_args}")
-
-                # Execute the function
-                if function_name in TOOL_FUNCTIONS:
-                    try:
-                        result = TOOL_FUNCTIONS[function_name](**function_args)
-                    except Exception as e:
-                        logger.error(f"Tool error: {function_name} - {e}")
-                        result = json.dumps({"error": str(e)})
-                else:
-                    logger.warning(f"Unknown function: {function_name}")
-                    result = json.dumps({"error": f"Unknown function: {function_name}"})
-
-                # Optimization #2: Truncate tool results (balanced - preserve product names)
-                truncated_result = truncate_tool_result(result, max_chars=2000)
-
+            # Results are added in the original call order
+            for tool_call, truncated_result in zip(tool_calls, results):
                 # Add to both histories
                 tool_message = {
                     "role": "tool",
-                    "tool_call_id": tool_call.id,
+                    "tool_call_id": tool_call["id"],
                     "content": truncated_result,
                 }
                 self.conversation_history.append(tool_message)
@@ -396,10 +606,13 @@ class STIHLAnalyticsAgent:
 
     def reset_conversation(self):
         """Clear conversation history and start fresh."""
-        self.conversation_history = [
-            {"role": "system", "content": BASE_SYSTEM_PROMPT}
-        ]
-        self.current_skill = None
+        # Waits for a running turn, which would otherwise append to the
+        # history after it has been reset
+        with self._turn_lock:
+            self.conversation_history = [
+                {"role": "system", "content": BASE_SYSTEM_PROMPT}
+            ]
+            self.current_skill = None
         logger.info("Conversation reset")
 
     def clear_caches(self):
@@ -408,6 +621,7 @@ class STIHLAnalyticsAgent:
             self.query_cache.clear()
         if self.semantic_cache:
             self.semantic_cache.clear()
+        self._embeddings.clear()
         logger.info("Caches cleared")
 
     def get_stats(self) -> dict:
@@ -8,7 +8,7 @@ Provides analytics on:
 """
 
 import json
-from agent.databricks_client import DatabricksClient
+from agent.databricks_client import get_databricks_client
 
 
 def query_dealer_data(
@@ -28,12 +28,15 @@ def query_dealer_data(
     Returns:
         JSON string with query results
     """
-    client = DatabricksClient()
+    client = get_databricks_client()
     
-    # Build base filters
+    # Build base filters; values are bound as parameters, never spliced
+    # into the SQL text
     filters = []
+    params = {}
     if region:
-        filters.append(f"region = '{region}'")
+        filters.append("region = :region")
+        params["region"] = region
     
     where_clause = f"WHERE {' AND '.join(filters)}" if filters else ""
     
@@ -141,7 +144,8 @@ def query_dealer_data(
         })
     
     try:
-        result = client.execute_query(query)
+        # Dealer aggregates change with the daily loads at most
+        result = client.execute_cached_query(query, params)
         return json.dumps({
             "query_type": query_type,
             "filters": {"region": region},
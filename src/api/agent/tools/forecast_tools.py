@@ -9,7 +9,7 @@ Provides:
 """
 
 import json
-from agent.databricks_client import DatabricksClient
+from agent.databricks_client import get_databricks_client
 
 
 def get_sales_forecast(
@@ -32,17 +32,21 @@ def get_sales_forecast(
     Returns:
         JSON string with forecast results
     """
-    client = DatabricksClient()
+    client = get_databricks_client()
     
     # Validate periods
     periods_ahead = min(max(periods_ahead, 1), 6)
     
-    # Build filters
+    # Build filters; values are bound as parameters, never spliced into
+    # the SQL text
     filters = []
+    params = {}
     if category:
-        filters.append(f"category = '{category}'")
+        filters.append("category = :category")
+        params["category"] = category
     if region:
-        filters.append(f"region = '{region}'")
+        filters.append("region = :region")
+        params["region"] = region
     
     where_clause = f"WHERE {' AND '.join(filters)}" if filters else ""
     group_cols = []
@@ -58,6 +62,7 @@ def get_sales_forecast(
             SELECT 
                 year,
                 month,
+                year * 12 + month as period_idx,
                 {', '.join(group_cols) + ',' if group_cols else ''}
                 SUM(total_revenue) as revenue,
                 SUM(total_units) as units
@@ -75,9 +80,7 @@ def get_sales_forecast(
                 STDDEV(revenue) as revenue_stddev,
                 MAX(year * 100 + month) as last_period
             FROM monthly_data
-            WHERE (year * 12 + month) >= (
-                SELECT MAX(year * 12 + month) - 2 FROM monthly_data
-            )
+            WHERE period_idx >= (SELECT MAX(period_idx) - 2 FROM monthly_data)
             {('GROUP BY ' + ', '.join(group_cols)) if group_cols else ''}
         )
         SELECT 
@@ -211,7 +214,10 @@ def get_sales_forecast(
         })
     
     try:
-        result = client.execute_query(query)
+        # All forecasts are computed from monthly_sales alone (year-end
+        # counts months_complete from the loaded data, not the clock), so
+        # they change with the daily loads at most
+        result = client.execute_cached_query(query, params)
         return json.dumps({
             "forecast_type": forecast_type,
             "method": method,
@@ -10,7 +10,7 @@ Provides:
 """
 
 import json
-from agent.databricks_client import DatabricksClient
+from agent.databricks_client import get_databricks_client
 
 
 def analyze_trends(
@@ -34,14 +34,18 @@ def analyze_trends(
     Returns:
         JSON string with trend analysis results
     """
-    client = DatabricksClient()
+    client = get_databricks_client()
     
-    # Build filters
+    # Build filters; values are bound as parameters, never spliced into
+    # the SQL text
     filters = []
+    params = {}
     if category:
-        filters.append(f"category = '{category}'")
+        filters.append("category = :category")
+        params["category"] = category
     if region:
-        filters.append(f"region = '{region}'")
+        filters.append("region = :region")
+        params["region"] = region
     
     where_clause = f"WHERE {' AND '.join(filters)}" if filters else ""
     
@@ -320,7 +324,7 @@ def analyze_trends(
         })
     
     try:
-        result = client.execute_query(query)
+        result = client.execute_query(query, params)
         return json.dumps({
             "trend_type": trend_type,
             "metric": metric,
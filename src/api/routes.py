@@ -3,6 +3,7 @@ STIHL Analytics Agent - API Routes
 Implements /agent, /chat/history, and /chat endpoints for the React frontend.
 """
 
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone
@@ -154,8 +155,11 @@ async def chat(request: Request):
     async def generate_response() -> AsyncGenerator[str, None]:
         """Generate SSE events for the response."""
         try:
-            # Get response from agent
-            response = agent.chat(user_message)
+            # Get response from agent. The turn runs in a worker thread,
+            # keeping the event loop free while it waits on the network;
+            # the agent serializes turns itself, so a client disconnect
+            # cancelling this await cannot let another turn overlap it.
+            response = await asyncio.to_thread(agent.chat, user_message)
             
             # Stream the response in chunks for better UX
             # (Your agent returns full response, so we simulate streaming)
@@ -225,7 +229,7 @@ async def reset_chat(request: Request):
     
     # Reset agent conversation
     agent = get_agent(request)
-    agent.reset_conversation()
+    await asyncio.to_thread(agent.reset_conversation)
     
     return JSONResponse(content={"status": "reset", "conversation_id": conversation_id})
 
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Agent modules are imported the way the API runs them, from src/api
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src/api")))
@@ -0,0 +1,118 @@
+from types import SimpleNamespace
+
+import pytest
+from agent.optimizations import cache
+from agent.optimizations.cache import QueryCache, SemanticCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the cache module's wall clock with a settable one."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(cache, "time", SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+def test_query_cache_evicts_least_recently_used():
+    query_cache = QueryCache(max_size=2)
+    query_cache.set("first", "1")
+    query_cache.set("second", "2")
+
+    assert query_cache.get("first").response == "1"
+    query_cache.set("third", "3")
+
+    assert query_cache.get("second") is None
+    assert query_cache.get("first").response == "1"
+    assert query_cache.get("third").response == "3"
+
+
+def test_query_cache_replacing_a_key_does_not_evict():
+    query_cache = QueryCache(max_size=2)
+    query_cache.set("first", "1")
+    query_cache.set("second", "2")
+    query_cache.set("first", "1b")
+
+    assert query_cache.get("first").response == "1b"
+    assert query_cache.get("second").response == "2"
+
+
+@pytest.mark.parametrize("variant", [
+    "YoY revenue?",
+    "yoy  revenue",
+    "  YOY\trevenue!! ",
+    "yoy revenue.",
+])
+def test_query_cache_normalizes_keys(variant):
+    query_cache = QueryCache()
+    query_cache.set("yoy revenue", "cached")
+
+    assert query_cache.get(variant).response == "cached"
+
+
+def test_query_cache_keeps_punctuation_only_queries():
+    query_cache = QueryCache()
+    query_cache.set("?", "question mark")
+
+    assert query_cache.get("?").response == "question mark"
+    assert query_cache.get("!") is None
+
+
+def test_query_cache_expires_entries(clock):
+    query_cache = QueryCache(ttl_seconds=60)
+    query_cache.set("revenue", "cached")
+
+    clock.value += 60
+    assert query_cache.get("revenue").response == "cached"
+    clock.value += 1
+    assert query_cache.get("revenue") is None
+
+
+def test_semantic_cache_expires_entries_lazily(clock):
+    semantic_cache = SemanticCache(similarity_threshold=0.9, ttl_seconds=60)
+    semantic_cache.set("old question", "old", [1.0, 0.0])
+    clock.value += 30
+    semantic_cache.set("new question", "new", [0.0, 1.0])
+
+    # Nothing has expired yet, so lookups do not sweep
+    assert semantic_cache._next_expiry_at == 1060.0
+    assert semantic_cache.get_similar("old question", [1.0, 0.0]).response == "old"
+
+    clock.value += 31
+    assert semantic_cache.get_similar("old question", [1.0, 0.0]) is None
+    assert semantic_cache.get_stats()["size"] == 1
+    assert semantic_cache._next_expiry_at == 1090.0
+    assert semantic_cache.get_similar("new question", [0.0, 1.0]).response == "new"
+
+    clock.value += 30
+    assert semantic_cache.get_similar("new question", [0.0, 1.0]) is None
+    assert semantic_cache.get_stats()["size"] == 0
+    assert semantic_cache._next_expiry_at == float("inf")
+
+
+def fill(semantic_cache, count):
+    for n in range(count):
+        semantic_cache.set(f"question {n}", f"answer {n}", [1.0, float(n)])
+
+
+def test_semantic_cache_evicts_one_entry_from_ring_buffer(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(cache, "faiss", None)
+    semantic_cache = SemanticCache(max_size=20)
+
+    fill(semantic_cache, 21)
+
+    assert semantic_cache.get_stats()["backend"] == "numpy"
+    assert list(semantic_cache._entries) == list(range(1, 21))
+
+
+def test_semantic_cache_evicts_faiss_entries_in_batches():
+    pytest.importorskip("faiss")
+    semantic_cache = SemanticCache(max_size=20)
+
+    fill(semantic_cache, 21)
+    assert semantic_cache.get_stats()["backend"] == "faiss"
+    assert list(semantic_cache._entries) == list(range(2, 21))
+
+    # The freed slot is reused before the next batch eviction
+    fill(semantic_cache, 1)
+    assert semantic_cache.get_stats()["size"] == 20
@@ -0,0 +1,232 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("databricks.sql")
+
+from agent import databricks_client
+from agent.databricks_client import DatabricksClient
+
+
+class FakeArrowTable:
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self.rows = rows
+
+    def to_pylist(self):
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+
+class FakeCursor:
+    """Serves scripted row tuples, recording the size of every batch fetch."""
+
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self.description = [(name, "string") for name in columns]
+        self.rowcount = -1
+        self.rows = list(rows)
+        self.fetch_sizes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, query, params=None):
+        self.executed = (query, params)
+
+    def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        return rows
+
+    def fetchmany_arrow(self, size):
+        return FakeArrowTable(self.columns, self.fetchmany(size))
+
+    def fetchone(self):
+        return self.rows.pop(0) if self.rows else None
+
+
+class FakeConnection:
+    def __init__(self, number: int, cursor=None):
+        self.number = number
+        self.closed = False
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+    def close(self):
+        self.closed = True
+
+
+def make_client(monkeypatch, cursor=None, **kwargs):
+    """A client whose _connect hands out numbered fake connections."""
+    client = DatabricksClient(
+        config=SimpleNamespace(host="example", http_path="/sql", token="token"),
+        **kwargs,
+    )
+    opened = []
+
+    def connect():
+        opened.append(FakeConnection(len(opened) + 1, cursor))
+        return opened[-1]
+
+    monkeypatch.setattr(client, "_connect", connect)
+    return client, opened
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the client module's monotonic clock with a settable one."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(databricks_client, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def test_connection_is_reused(monkeypatch, clock):
+    client, opened = make_client(monkeypatch)
+
+    with client.connection() as first:
+        pass
+    with client.connection() as second:
+        pass
+
+    assert second is first
+    assert len(opened) == 1
+    assert not first.closed
+
+
+def test_idle_connection_is_discarded(monkeypatch, clock):
+    client, opened = make_client(monkeypatch, max_idle_seconds=60)
+
+    with client.connection() as first:
+        pass
+    clock.value += 61
+    with client.connection() as second:
+        pass
+
+    assert second is not first
+    assert first.closed
+    assert len(opened) == 2
+
+
+def test_connection_is_closed_when_block_raises(monkeypatch, clock):
+    client, opened = make_client(monkeypatch)
+
+    with pytest.raises(RuntimeError), client.connection():
+        raise RuntimeError("session expired")
+    with client.connection() as second:
+        pass
+
+    assert opened[0].closed
+    assert second is opened[1]
+
+
+def test_full_pool_closes_released_connection(monkeypatch, clock):
+    client = make_client(monkeypatch, pool_size=1)[0]
+
+    with client.connection() as outer, client.connection() as inner:
+        pass
+
+    # inner is released first and takes the only pool slot
+    assert not inner.closed
+    assert outer.closed
+
+
+@pytest.mark.parametrize("arrow", [True, False], ids=["arrow", "tuples"])
+def test_execute_query_returns_row_dicts(monkeypatch, arrow):
+    monkeypatch.setattr(databricks_client, "pyarrow", object() if arrow else None)
+    cursor = FakeCursor(["region", "revenue"], [("West", 10.5), ("East", 7.25), ("North", 3.0)])
+    client = make_client(monkeypatch, cursor)[0]
+
+    result = client.execute_query("SELECT region, revenue", {"year": 2025}, max_rows=2)
+
+    assert cursor.executed == ("SELECT region, revenue", {"year": 2025})
+    assert result == {
+        "success": True,
+        "row_count": 2,
+        "has_more": True,
+        "columns": ["region", "revenue"],
+        "data": [{"region": "West", "revenue": 10.5}, {"region": "East", "revenue": 7.25}],
+    }
+
+
+@pytest.mark.parametrize("arrow", [True, False], ids=["arrow", "tuples"])
+def test_execute_query_fetches_bounded_batches(monkeypatch, arrow):
+    monkeypatch.setattr(databricks_client, "pyarrow", object() if arrow else None)
+    monkeypatch.setattr(databricks_client, "FETCH_BATCH_ROWS", 4)
+    cursor = FakeCursor(["n"], [(n,) for n in range(20)])
+    client = make_client(monkeypatch, cursor)[0]
+
+    result = client.execute_query("SELECT n", max_rows=10)
+
+    assert cursor.fetch_sizes == [4, 4, 2]
+    assert [row["n"] for row in result["data"]] == list(range(10))
+    assert result["has_more"] is True
+
+
+def test_execute_query_stops_at_last_batch(monkeypatch):
+    monkeypatch.setattr(databricks_client, "pyarrow", None)
+    monkeypatch.setattr(databricks_client, "FETCH_BATCH_ROWS", 4)
+    cursor = FakeCursor(["n"], [(n,) for n in range(5)])
+    client = make_client(monkeypatch, cursor)[0]
+
+    result = client.execute_query("SELECT n", max_rows=100)
+
+    assert cursor.fetch_sizes == [4, 4, 4]
+    assert result["row_count"] == 5
+    assert result["has_more"] is False
+
+
+def record_queries(monkeypatch, client, *results):
+    """Make execute_query return the given results in turn, recording calls."""
+    calls = []
+    pending = list(results)
+
+    def execute_query(query, params=None, max_rows=100):
+        calls.append((query, params, max_rows))
+        return pending.pop(0)
+
+    monkeypatch.setattr(client, "execute_query", execute_query)
+    return calls
+
+
+def test_cached_query_is_served_within_ttl(monkeypatch, clock):
+    client = make_client(monkeypatch)[0]
+    first, second = {"success": True, "data": [1]}, {"success": True, "data": [2]}
+    calls = record_queries(monkeypatch, client, first, second)
+
+    assert client.execute_cached_query("SELECT 1", {"region": "West"}, ttl_seconds=60) is first
+    clock.value += 60
+    assert client.execute_cached_query("SELECT 1", {"region": "West"}, ttl_seconds=60) is first
+    clock.value += 1
+    assert client.execute_cached_query("SELECT 1", {"region": "West"}, ttl_seconds=60) is second
+
+    assert len(calls) == 2
+
+
+def test_cached_query_keys_on_params_and_max_rows(monkeypatch, clock):
+    client = make_client(monkeypatch)[0]
+    calls = record_queries(monkeypatch, client, *({"success": True} for _ in range(3)))
+
+    client.execute_cached_query("SELECT 1", {"region": "West"})
+    client.execute_cached_query("SELECT 1", {"region": "East"})
+    client.execute_cached_query("SELECT 1", {"region": "West"}, max_rows=10)
+    client.execute_cached_query("SELECT 1", {"region": "West"})
+
+    assert len(calls) == 3
+
+
+def test_failed_query_is_not_cached(monkeypatch, clock):
+    client = make_client(monkeypatch)[0]
+    failure = {"success": False, "error": "warehouse starting"}
+    success = {"success": True, "data": []}
+    calls = record_queries(monkeypatch, client, failure, success)
+
+    assert client.execute_cached_query("SELECT 1") is failure
+    assert client.execute_cached_query("SELECT 1") is success
+    assert client.execute_cached_query("SELECT 1") is success
+
+    assert len(calls) == 2
@@ -0,0 +1,72 @@
+from agent.optimizations.history import ConversationHistoryManager, HistoryConfig
+
+
+def tool_turn(turn: int) -> list[dict]:
+    """One user turn answered after a single tool call."""
+    call_id = f"call_{turn}"
+    return [
+        {"role": "user", "content": f"question {turn}"},
+        {
+            "role": "assistant",
+            "tool_calls": [{
+                "id": call_id,
+                "type": "function",
+                "function": {"name": "query_sales_data", "arguments": "{}"},
+            }],
+        },
+        {"role": "tool", "tool_call_id": call_id, "content": f"result {turn}"},
+        {"role": "assistant", "content": f"answer {turn}"},
+    ]
+
+
+def conversation(turns: int) -> list[dict]:
+    history = [{"role": "system", "content": "system prompt"}]
+    for turn in range(1, turns + 1):
+        history.extend(tool_turn(turn))
+    return history
+
+
+def assert_tool_results_follow_their_calls(messages: list[dict]):
+    requested = set()
+    for message in messages:
+        if message["role"] == "tool":
+            assert message["tool_call_id"] in requested
+        elif message["role"] != "assistant" or not message.get("tool_calls"):
+            requested = set()
+        else:
+            requested = {call["id"] for call in message["tool_calls"]}
+
+
+def test_optimize_collapses_earlier_tool_turns():
+    manager = ConversationHistoryManager(HistoryConfig(keep_last_tool_turns=2))
+
+    optimized = manager.optimize(conversation(3))
+
+    assert [m["tool_call_id"] for m in optimized if m["role"] == "tool"] == ["call_2", "call_3"]
+    assert optimized[1:4] == [
+        {"role": "user", "content": "question 1"},
+        {"role": "assistant", "content": "[Used tools: query_sales_data; results omitted]"},
+        {"role": "assistant", "content": "answer 1"},
+    ]
+    assert optimized[4:] == conversation(3)[5:]
+    assert_tool_results_follow_their_calls(optimized)
+
+
+def test_optimize_keeps_all_tool_turns_within_window():
+    manager = ConversationHistoryManager(HistoryConfig(keep_last_tool_turns=2))
+    history = conversation(2)
+
+    assert manager.optimize(history) == history
+
+
+def test_prune_drops_tool_results_cut_from_their_calls():
+    manager = ConversationHistoryManager()
+    history = conversation(3)
+
+    # Keeps the system prompt plus the last 6 messages, a cut that falls
+    # between turn 2's tool call and its result
+    pruned = manager.prune(history, max_messages=7)
+
+    assert pruned[0] == history[0]
+    assert pruned[1:] == history[-5:]
+    assert_tool_results_follow_their_calls(pruned)
@@ -0,0 +1,226 @@
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("databricks.sql")
+
+from agent import stihl_agent
+from agent.stihl_agent import STIHLAnalyticsAgent
+
+
+def chunk(content=None, tool_calls=None):
+    """A streamed chat.completion.chunk with a single choice."""
+    return SimpleNamespace(choices=[
+        SimpleNamespace(delta=SimpleNamespace(content=content, tool_calls=tool_calls))
+    ])
+
+
+def call_delta(index, call_id=None, name=None, arguments=None):
+    return SimpleNamespace(
+        index=index,
+        id=call_id,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+def tool_call_chunks(*calls):
+    """Chunks streaming each (id, name, arguments) call in two argument pieces."""
+    chunks = []
+    for index, (call_id, name, arguments) in enumerate(calls):
+        half = len(arguments) // 2
+        chunks.append(chunk(tool_calls=[call_delta(index, call_id, name, arguments[:half])]))
+        chunks.append(chunk(tool_calls=[call_delta(index, arguments=arguments[half:])]))
+    return chunks
+
+
+def filter_chunk():
+    """The Azure prompt-filter results chunk, which carries no choices."""
+    return SimpleNamespace(choices=[])
+
+
+class FakeCompletions:
+    """Replays one scripted chunk stream per create() call."""
+
+    def __init__(self, *streams):
+        self.streams = list(streams)
+        self.requests = []
+
+    def create(self, **kwargs):
+        self.requests.append(kwargs)
+        return iter(self.streams.pop(0))
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+    monkeypatch.setenv("AZURE_OPENAI_API_KEY", "test-key")
+    return STIHLAnalyticsAgent(
+        use_skill_routing=False,
+        use_caching=False,
+        use_semantic_cache=False,
+    )
+
+
+def use_streams(agent, *streams) -> FakeCompletions:
+    completions = FakeCompletions(*streams)
+    agent.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return completions
+
+
+def record_calls(monkeypatch, name, calls):
+    def tool(**kwargs):
+        calls.append(kwargs)
+        return json.dumps({"tool": name, "call": len(calls)})
+    monkeypatch.setitem(stihl_agent.TOOL_FUNCTIONS, name, tool)
+
+
+def tool_messages(agent):
+    return [m for m in agent.conversation_history if m["role"] == "tool"]
+
+
+def test_identical_read_calls_share_one_execution(agent, monkeypatch):
+    calls = []
+    record_calls(monkeypatch, "query_sales_data", calls)
+    args = '{"query_type": "summary"}'
+    use_streams(
+        agent,
+        tool_call_chunks(("call_1", "query_sales_data", args), ("call_2", "query_sales_data", args)),
+        [chunk("Done")],
+    )
+
+    assert agent.chat("sales summary") == "Done"
+
+    assert calls == [{"query_type": "summary"}]
+    messages = tool_messages(agent)
+    assert [m["tool_call_id"] for m in messages] == ["call_1", "call_2"]
+    assert messages[0]["content"] == messages[1]["content"]
+
+
+def test_identical_side_effecting_calls_each_run(agent, monkeypatch):
+    calls = []
+    record_calls(monkeypatch, "create_shipment_request", calls)
+    args = '{"product_id": "MS-500I", "quantity": 10}'
+    use_streams(
+        agent,
+        tool_call_chunks(
+            ("call_1", "create_shipment_request", args),
+            ("call_2", "create_shipment_request", args),
+        ),
+        [chunk("Created")],
+    )
+
+    agent.chat("ship two batches")
+
+    assert len(calls) == 2
+    assert [m["tool_call_id"] for m in tool_messages(agent)] == ["call_1", "call_2"]
+
+
+def test_text_only_response_skips_prompt_filter_chunk(agent):
+    completions = use_streams(agent, [filter_chunk(), chunk("Sales "), chunk("are up.")])
+
+    assert agent.chat("how are sales?") == "Sales are up."
+
+    assert completions.requests[0]["stream"] is True
+    assert agent.conversation_history[-1] == {"role": "assistant", "content": "Sales are up."}
+    assert tool_messages(agent) == []
+
+
+def test_interleaved_tool_call_deltas(agent, monkeypatch):
+    sales, inventory = [], []
+    record_calls(monkeypatch, "query_sales_data", sales)
+    record_calls(monkeypatch, "query_inventory_data", inventory)
+    use_streams(
+        agent,
+        [
+            filter_chunk(),
+            chunk(tool_calls=[call_delta(0, "call_1", "query_sales_data", '{"query_type": ')]),
+            chunk(tool_calls=[call_delta(1, "call_2", "query_inventory_data", '{"query_type": ')]),
+            chunk(tool_calls=[call_delta(0, arguments='"summary"}')]),
+            chunk(tool_calls=[call_delta(1, arguments='"low_stock"}')]),
+        ],
+        [chunk("Done")],
+    )
+
+    assert agent.chat("sales and stock") == "Done"
+
+    assert sales == [{"query_type": "summary"}]
+    assert inventory == [{"query_type": "low_stock"}]
+    assistant = agent.conversation_history[-4]
+    assert [c["function"]["arguments"] for c in assistant["tool_calls"]] == [
+        '{"query_type": "summary"}',
+        '{"query_type": "low_stock"}',
+    ]
+    messages = tool_messages(agent)
+    assert [m["tool_call_id"] for m in messages] == ["call_1", "call_2"]
+    assert [json.loads(m["content"])["tool"] for m in messages] == [
+        "query_sales_data",
+        "query_inventory_data",
+    ]
+
+
+def test_read_call_starts_while_stream_continues(agent, monkeypatch):
+    started = threading.Event()
+
+    def query_sales_data(**kwargs):
+        started.set()
+        return json.dumps({"success": True})
+
+    monkeypatch.setitem(stihl_agent.TOOL_FUNCTIONS, "query_sales_data", query_sales_data)
+    record_calls(monkeypatch, "get_daily_briefing", [])
+    seen_before_end = []
+
+    def stream():
+        yield from tool_call_chunks(("call_1", "query_sales_data", '{"query_type": "summary"}'))
+        yield chunk(tool_calls=[call_delta(1, "call_2", "get_daily_briefing", "{}")])
+        seen_before_end.append(started.wait(timeout=5))
+
+    use_streams(agent, stream(), [chunk("Done")])
+
+    assert agent.chat("sales summary and briefing") == "Done"
+    assert seen_before_end == [True]
+
+
+def test_broken_stream_runs_no_side_effecting_calls(agent, monkeypatch):
+    shipments = []
+    record_calls(monkeypatch, "create_shipment_request", shipments)
+
+    def stream():
+        yield from tool_call_chunks(
+            ("call_1", "create_shipment_request", '{"product_id": "MS-500I", "quantity": 10}')
+        )
+        yield chunk(tool_calls=[call_delta(1, "call_2", "create_shipment_request", "{")])
+        raise ConnectionError("stream interrupted")
+
+    use_streams(agent, stream())
+
+    with pytest.raises(ConnectionError):
+        agent.chat("ship MS-500I")
+
+    assert shipments == []
+
+
+def test_reset_waits_for_the_running_turn(agent):
+    in_turn, resume = threading.Event(), threading.Event()
+
+    def stream():
+        in_turn.set()
+        resume.wait(timeout=5)
+        yield chunk("Done")
+
+    use_streams(agent, stream())
+    turn = threading.Thread(target=agent.chat, args=("how are sales?",))
+    turn.start()
+    assert in_turn.wait(timeout=5)
+    reset = threading.Thread(target=agent.reset_conversation)
+    reset.start()
+    reset.join(timeout=0.1)
+    assert reset.is_alive()
+
+    resume.set()
+    turn.join(timeout=5)
+    reset.join(timeout=5)
+
+    assert [m["role"] for m in agent.conversation_history] == ["system"]
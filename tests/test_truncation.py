@@ -0,0 +1,106 @@
+import json
+
+from agent.optimizations.truncation import truncate_tool_result
+
+TOP_PRODUCTS_COLUMNS = ["product_name", "category", "revenue", "units_sold", "transaction_count"]
+
+
+def top_products_result(rows: int, name_length: int = 20) -> dict:
+    return {
+        "success": True,
+        "query_type": "top_products",
+        "row_count": rows,
+        "has_more": False,
+        "columns": TOP_PRODUCTS_COLUMNS,
+        "data": [
+            {
+                "product_name": f"P{i:03d}" + "x" * name_length,
+                "category": "Chainsaws",
+                "revenue": 1000.5 + i,
+                "units_sold": 10 + i,
+                "transaction_count": 3 + i,
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+def test_known_schema_keeps_leading_rows_within_budget():
+    result = top_products_result(50, name_length=400)
+
+    output = truncate_tool_result(json.dumps(result), max_chars=2000)
+
+    assert len(output) <= 2000
+    truncated = json.loads(output)
+    assert truncated["row_count"] == 50
+    data = truncated["data"]
+    assert data["total_count"] == 50
+    assert 1 <= data["showing"] == len(data["items"]) < 8
+    for i, item in enumerate(data["items"]):
+        assert item["product_name"].startswith(f"P{i:03d}")
+        assert len(item["product_name"]) < 400
+        assert item["revenue"] == 1000.5 + i
+
+
+def test_known_schema_small_rows_keep_max_items():
+    result = top_products_result(50)
+
+    truncated = json.loads(truncate_tool_result(json.dumps(result), max_chars=2000))
+
+    assert truncated["data"]["showing"] == 8
+    assert [item["units_sold"] for item in truncated["data"]["items"]] == list(range(10, 18))
+
+
+class DigitHeavyEncoder:
+    """Counts every digit as a token and four other characters as one."""
+
+    def encode(self, text, disallowed_special=()):
+        digits = sum(ch.isdigit() for ch in text)
+        return [0] * (digits + (len(text) - digits) // 4)
+
+
+def dealer_result(rows: int) -> dict:
+    return {
+        "query_type": "top_dealers",
+        "filters": {"region": None},
+        "data": {
+            "success": True,
+            "row_count": rows,
+            "has_more": True,
+            "columns": ["dealer_id", "dealer_name", "total_revenue", "total_units_sold"],
+            "data": [
+                {
+                    "dealer_id": 100000 + i,
+                    "dealer_name": f"Dealer {i}",
+                    "total_revenue": 1234567.891 + i,
+                    "total_units_sold": 98765 + i,
+                }
+                for i in range(rows)
+            ],
+        },
+        "record_count": rows,
+    }
+
+
+def test_token_budget_is_met_and_keeps_leading_rows(monkeypatch):
+    encoder = DigitHeavyEncoder()
+    monkeypatch.setattr("agent.optimizations.truncation._encoder", encoder)
+
+    output = truncate_tool_result(json.dumps(dealer_result(100)), max_chars=2000, max_tokens=150)
+
+    assert len(encoder.encode(output)) <= 150
+    truncated = json.loads(output)
+    assert truncated["record_count"] == 100
+    rows = truncated["data"]
+    assert rows["row_count"] == 100
+    assert rows["has_more"] is True
+    items = rows["data"]["items"]
+    assert items
+    assert [item["dealer_name"] for item in items] == [f"Dealer {i}" for i in range(len(items))]
+
+
+def test_token_budget_unused_without_encoder(monkeypatch):
+    monkeypatch.setattr("agent.optimizations.truncation._encoder", False)
+    result = json.dumps(dealer_result(100))
+
+    assert truncate_tool_result(result, max_tokens=150) == truncate_tool_result(result)